@@ -0,0 +1,118 @@
+"""Phaethon: a value-aligned attention guardian.
+
+Top-level names are resolved lazily (PEP 562) so that ``import
+phaethon`` does not drag in the scoring/learning/server stacks until a
+symbol from them is actually used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+__version__ = "0.1.0"
+
+# Symbol -> defining module. Each name in __all__ is imported on first
+# attribute access and then cached in the module globals.
+_LAZY = {
+    "BaseAdapter": "phaethon.adapters",
+    "DecisionEngine": "phaethon.core.decision_engine",
+    "RulesEngine": "phaethon.core.rules_engine",
+    "ContentFeatures": "phaethon.core.schemas",
+    "ContentItem": "phaethon.core.schemas",
+    "ContentMetadata": "phaethon.core.schemas",
+    "ContentType": "phaethon.core.schemas",
+    "EventLevel": "phaethon.core.schemas",
+    "EventLog": "phaethon.core.schemas",
+    "FeedbackType": "phaethon.core.schemas",
+    "InterventionAction": "phaethon.core.schemas",
+    "InterventionDecision": "phaethon.core.schemas",
+    "InterventionRule": "phaethon.core.schemas",
+    "ScoringResult": "phaethon.core.schemas",
+    "SystemSettings": "phaethon.core.schemas",
+    "UserFeedback": "phaethon.core.schemas",
+    "UserPreferences": "phaethon.core.schemas",
+    "UserProfile": "phaethon.core.schemas",
+    "ValueProfile": "phaethon.core.schemas",
+    "BehavioralAnalyzer": "phaethon.learning.behavioral_patterns",
+    "FeedbackProcessor": "phaethon.learning.feedback_processor",
+    "BayesianValuesEstimator": "phaethon.learning.values_estimator",
+    "ContentFeatureExtractor": "phaethon.scoring.content_features",
+    "ContentScorer": "phaethon.scoring.scorer",
+    "EventLogger": "phaethon.storage.event_logger",
+    "UserProfileManager": "phaethon.storage.user_profiles",
+}
+
+__all__ = [
+    "BaseAdapter",
+    "BayesianValuesEstimator",
+    "BehavioralAnalyzer",
+    "ContentFeatureExtractor",
+    "ContentFeatures",
+    "ContentItem",
+    "ContentMetadata",
+    "ContentScorer",
+    "ContentType",
+    "DecisionEngine",
+    "EventLevel",
+    "EventLog",
+    "EventLogger",
+    "FeedbackProcessor",
+    "FeedbackType",
+    "InterventionAction",
+    "InterventionDecision",
+    "InterventionRule",
+    "RulesEngine",
+    "ScoringResult",
+    "SystemSettings",
+    "UserFeedback",
+    "UserPreferences",
+    "UserProfile",
+    "UserProfileManager",
+    "ValueProfile",
+]
+
+if TYPE_CHECKING:
+    from .adapters import BaseAdapter
+    from .core.decision_engine import DecisionEngine
+    from .core.rules_engine import RulesEngine
+    from .core.schemas import (
+        ContentFeatures,
+        ContentItem,
+        ContentMetadata,
+        ContentType,
+        EventLevel,
+        EventLog,
+        FeedbackType,
+        InterventionAction,
+        InterventionDecision,
+        InterventionRule,
+        ScoringResult,
+        SystemSettings,
+        UserFeedback,
+        UserPreferences,
+        UserProfile,
+        ValueProfile,
+    )
+    from .learning.behavioral_patterns import BehavioralAnalyzer
+    from .learning.feedback_processor import FeedbackProcessor
+    from .learning.values_estimator import BayesianValuesEstimator
+    from .scoring.content_features import ContentFeatureExtractor
+    from .scoring.scorer import ContentScorer
+    from .storage.event_logger import EventLogger
+    from .storage.user_profiles import UserProfileManager
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    module = importlib.import_module(module_name)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
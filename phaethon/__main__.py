@@ -0,0 +1,63 @@
+"""Command-line entrypoint: ``python -m phaethon`` starts the server."""
+
+import argparse
+import sys
+
+BANNER = r"""
+  ____  _                 _   _
+ |  _ \| |__   __ _  ___ | |_| |__   ___  _ __
+ | |_) | '_ \ / _` |/ _ \| __| '_ \ / _ \| '_ \
+ |  __/| | | | (_| |  __/| |_| | | | (_) | | | |
+ |_|   |_| |_|\__,_|\___| \__|_| |_|\___/|_| |_|
+
+ value-aligned attention guardian
+"""
+
+
+def print_banner(host: str, port: int) -> None:
+    print(BANNER)
+    print(f" serving on http://{host}:{port}\n")
+
+
+def main(argv=None) -> int:
+    # Parse arguments before importing uvicorn/config so that --help
+    # (and bad invocations) return without paying server import cost.
+    parser = argparse.ArgumentParser(
+        prog="phaethon", description="Run the Phaethon API server."
+    )
+    parser.add_argument("--host", default=None, help="bind host (default from config)")
+    parser.add_argument("--port", type=int, default=None, help="bind port")
+    parser.add_argument("--workers", type=int, default=None, help="worker count")
+    parser.add_argument(
+        "-q", "--quiet", action="store_true", help="suppress the startup banner"
+    )
+    args = parser.parse_args(argv)
+
+    import uvicorn
+
+    from phaethon import config
+
+    config.ensure_data_dirs()
+
+    host = args.host if args.host is not None else config.API_HOST
+    port = args.port if args.port is not None else config.API_PORT
+    workers = args.workers if args.workers is not None else config.API_WORKERS
+
+    if not args.quiet:
+        print_banner(host, port)
+    # loop/http stay on "auto": uvicorn then picks uvloop and httptools
+    # (the phaethon[fastserve] extra) when present, with a clean
+    # fallback to the stdlib loop and h11 when not. Access logging is
+    # a per-request formatting call, so it is off by default.
+    uvicorn.run(
+        "phaethon.server.app:app",
+        host=host,
+        port=port,
+        workers=workers,
+        access_log=False,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,34 @@
+"""Content-source adapters.
+
+An adapter bridges Phaethon to one content surface (a browser
+extension, an RSS reader, a mail client). It fetches candidate content
+items and applies the resulting decisions back to the surface.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+from ..core.schemas import ContentItem, InterventionDecision
+
+
+class BaseAdapter(ABC):
+    """Base class every content-source adapter implements.
+
+    Slotted: adapters can exist per connection or per request, so
+    instances carry no ``__dict__``. Subclasses must declare their own
+    ``__slots__`` (``()`` if they add no attributes) to keep that true.
+    """
+
+    __slots__ = ("config", "name")
+
+    def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.config = config or {}
+
+    @abstractmethod
+    def fetch_content(self) -> List[ContentItem]:
+        """Return new content items from this source."""
+
+    @abstractmethod
+    def apply_decision(self, decision: InterventionDecision) -> None:
+        """Enact a decision on the source surface."""
@@ -0,0 +1,40 @@
+"""Runtime configuration for Phaethon.
+
+All state lives under ``DATA_DIR`` (``~/.phaethon`` by default); every
+setting can be overridden through a ``PHAETHON_*`` environment variable.
+"""
+
+import os
+import types
+from pathlib import Path
+
+DATA_DIR = Path(os.environ.get("PHAETHON_DATA_DIR", str(Path.home() / ".phaethon")))
+VALUES_DIR = DATA_DIR / "values"
+DB_PATH = DATA_DIR / "phaethon.db"
+
+API_HOST = os.environ.get("PHAETHON_HOST", "127.0.0.1")
+API_PORT = int(os.environ.get("PHAETHON_PORT", "8777"))
+API_WORKERS = int(os.environ.get("PHAETHON_WORKERS", "1"))
+
+# Seed hierarchy for new users: category -> value dimensions. Each
+# dimension starts at DEFAULT_VALUE_WEIGHT and is refined from feedback.
+# Read-only view: mutating it would silently change every new profile.
+DEFAULT_VALUE_HIERARCHY = types.MappingProxyType(
+    {
+        "productivity": ["learning", "focus", "output_quality"],
+        "wellbeing": ["sleep_quality", "stress_reduction", "social_connection"],
+        "autonomy": ["intentional_use", "time_awareness"],
+    }
+)
+
+DEFAULT_VALUE_WEIGHT = 0.5
+
+
+def ensure_data_dirs() -> None:
+    """Create DATA_DIR and VALUES_DIR if they do not exist yet.
+
+    Called by components that write to disk; importing this module
+    (e.g. just to read a constant) never touches the filesystem.
+    """
+    DATA_DIR.mkdir(exist_ok=True)
+    VALUES_DIR.mkdir(exist_ok=True)
@@ -0,0 +1 @@
+"""Core schemas and decision logic."""
@@ -0,0 +1,107 @@
+"""Combines rule evaluation and scoring into a final decision."""
+
+from datetime import datetime
+from typing import Optional
+
+from ..scoring.scorer import ContentScorer
+from .rules_engine import RulesEngine
+from .schemas import (
+    ContentItem,
+    InterventionAction,
+    InterventionDecision,
+    ScoringResult,
+    UserProfile,
+)
+
+
+def _constrained_action(
+    action: InterventionAction, wellbeing_bucket: int, implicit_feedback: bool
+) -> InterventionAction:
+    """Reference implementation of the safety constraints.
+
+    Run once per combination at import to fill ``_ACTION_TABLE``; the
+    per-decision path is a single dict lookup.
+    """
+    # Never prioritize content with a negative wellbeing signal.
+    if action == InterventionAction.ALLOW_PRIORITIZE and wellbeing_bucket == -1:
+        return InterventionAction.ALLOW
+    # Without implicit feedback we cannot learn from silent delays,
+    # so surface a warning instead.
+    if action == InterventionAction.DELAY and not implicit_feedback:
+        return InterventionAction.WARN
+    return action
+
+
+_ACTION_TABLE = {
+    (action, bucket, implicit): _constrained_action(action, bucket, implicit)
+    for action in InterventionAction
+    for bucket in (-1, 0)
+    for implicit in (True, False)
+}
+
+# Shared for the (common) no-match branch: no per-decision allocation.
+_EMPTY_RULES: tuple = ()
+
+
+class DecisionEngine:
+    """Decides what to do with a content item for a given user.
+
+    User rules always win; otherwise the scored recommendation is used,
+    then safety constraints are applied on top.
+    """
+
+    def __init__(
+        self,
+        rules_engine: Optional[RulesEngine] = None,
+        scorer: Optional[ContentScorer] = None,
+    ):
+        self.rules_engine = rules_engine or RulesEngine()
+        self.scorer = scorer or ContentScorer()
+
+    def make_decision(
+        self, content: ContentItem, user_profile: UserProfile
+    ) -> InterventionDecision:
+        """Evaluate rules and scores and return the final decision."""
+        applied_rules = _EMPTY_RULES
+        reasoning = []
+
+        rule_action, matched_rule = self.rules_engine.evaluate_for_profile(
+            content, user_profile
+        )
+        scoring = self.scorer.score_content(content, user_profile)
+
+        if matched_rule is not None:
+            action = rule_action
+            applied_rules = [
+                {
+                    "rule_id": matched_rule.rule_id,
+                    "priority": matched_rule.priority,
+                    "reason": matched_rule.reason,
+                }
+            ]
+            reasoning.append(f"matched rule {matched_rule.rule_id}")
+        else:
+            action = scoring.recommended_action
+            reasoning.extend(scoring.reasoning)
+
+        action = _ACTION_TABLE[
+            (
+                action,
+                -1 if scoring.wellbeing_impact <= -0.1 else 0,
+                user_profile.preferences.enable_implicit_feedback,
+            )
+        ]
+
+        # Every field below is produced by trusted internal code, so
+        # skip pydantic validation; untrusted input is validated at the
+        # API boundary before it ever reaches this method.
+        return InterventionDecision.model_construct(
+            content_id=content.content_id,
+            user_id=user_profile.user_id,
+            action=action,
+            scores=scoring,
+            applied_rules=applied_rules,
+            reasoning=reasoning,
+            timestamp=datetime.utcnow(),
+        )
+
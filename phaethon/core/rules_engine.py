@@ -0,0 +1,359 @@
+"""Rule matching and evaluation against content items."""
+
+import heapq
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+try:  # optional: single-pass keyword scanning (phaethon[fastmatch])
+    import ahocorasick
+except ImportError:  # pragma: no cover - exercised only without the extra
+    ahocorasick = None
+
+from .schemas import ContentItem, InterventionAction, InterventionRule, UserProfile
+
+
+class CompiledRules:
+    """A profile's active rules, prepared once for repeated matching.
+
+    Rules are priority-sorted and their string fields pre-lowercased so
+    per-decision matching does no sorting and no ``.lower()`` churn.
+    Instances are cached on the profile and rebuilt whenever the
+    profile is reloaded after a rule mutation.
+    """
+
+    __slots__ = ("entries",)
+
+    def __init__(self, rules: List[InterventionRule]):
+        self.entries = [
+            (
+                rule,
+                rule.domain.lower() if rule.domain else None,
+                tuple(kw.lower() for kw in rule.keyword_includes),
+                tuple(kw.lower() for kw in rule.keyword_excludes),
+            )
+            for rule in sorted(
+                (r for r in rules if r.is_active),
+                key=lambda r: r.priority,
+                reverse=True,
+            )
+        ]
+
+
+# Cached per-rule matching data: (lowered domain or None,
+# lowered include keywords, lowered exclude keywords).
+_CachedRule = Tuple[Optional[str], Tuple[str, ...], Tuple[str, ...]]
+
+# Below this many items, process startup and pickling outweigh the
+# parallel speedup and the batch is evaluated serially.
+_MIN_PARALLEL_BATCH = 512
+
+
+def _evaluate_chunk(
+    args: Tuple[List[InterventionRule], List[ContentItem]],
+) -> List[Tuple[Optional[InterventionAction], Optional[InterventionRule]]]:
+    """Worker entry point: index once, then evaluate a content chunk."""
+    rules, contents = args
+    engine = RulesEngine()
+    engine.index_rules(rules)
+    return [engine.evaluate_rules(content, rules) for content in contents]
+
+
+class RulesEngine:
+    """Matches user-authored intervention rules against content."""
+
+    def __init__(self):
+        # Lowercased rule fields, built lazily per rule_id so the
+        # matching loop never re-lowers the same rule twice.
+        self._rule_cache: Dict[str, _CachedRule] = {}
+        # Inverted keyword index over one rules list (see index_rules).
+        self._include_index: Dict[str, Set[str]] = {}
+        self._no_include_rules: Set[str] = set()
+        self._indexed_rules: Dict[str, InterventionRule] = {}
+        self._indexed_from: Optional[List[InterventionRule]] = None
+        # Aho-Corasick automaton over every include/exclude keyword,
+        # built when the optional pyahocorasick extra is installed.
+        self._automaton = None
+        # Priority-sorted view of one rules list (see prepare).
+        self._prepared: List[InterventionRule] = []
+        self._prepared_from: Optional[List[InterventionRule]] = None
+
+    def prepare(self, rules: List[InterventionRule]) -> List[InterventionRule]:
+        """Return ``rules`` active-only and priority-sorted, memoized.
+
+        Evaluating a prepared list lets :meth:`evaluate_rules` stop at
+        the first match instead of scanning every rule. The memo is
+        keyed on list identity: edit the rules through a new list (or
+        call prepare again) to refresh it.
+        """
+        if rules is self._prepared_from:
+            return self._prepared
+        prepared = sorted(
+            (r for r in rules if r.is_active),
+            key=lambda r: r.priority,
+            reverse=True,
+        )
+        self._prepared = prepared
+        self._prepared_from = rules
+        return prepared
+
+    def index_rules(self, rules: List[InterventionRule]) -> None:
+        """Build an inverted include-keyword index over ``rules``.
+
+        Once indexed, :meth:`evaluate_rules` on the same list checks only
+        rules with at least one include keyword present in the title
+        (plus rules with no include keywords, which can always match).
+        Keywords shared across rules are scanned once instead of once per
+        rule, and the scan is a plain substring test, so candidates carry
+        exactly the semantics of the unindexed path.
+
+        When pyahocorasick is installed, an automaton over every include
+        and exclude keyword is built as well; evaluation then finds all
+        keyword hits in one pass over the title, with full substring
+        semantics, instead of consulting the token index.
+        """
+        include_index: Dict[str, Set[str]] = defaultdict(set)
+        no_include: Set[str] = set()
+        keyword_refs: Dict[str, List[Tuple[str, bool]]] = defaultdict(list)
+        indexed: Dict[str, InterventionRule] = {}
+        for rule in rules:
+            if not rule.is_active:
+                continue
+            indexed[rule.rule_id] = rule
+            _, includes, excludes = self._cached(rule)
+            if not includes:
+                no_include.add(rule.rule_id)
+            for kw in includes:
+                keyword_refs[kw].append((rule.rule_id, True))
+                include_index[kw].add(rule.rule_id)
+            for kw in excludes:
+                keyword_refs[kw].append((rule.rule_id, False))
+        self._include_index = dict(include_index)
+        self._no_include_rules = no_include
+        self._indexed_rules = indexed
+        self._indexed_from = rules
+        self._automaton = None
+        if ahocorasick is not None and keyword_refs:
+            automaton = ahocorasick.Automaton()
+            for kw, refs in keyword_refs.items():
+                automaton.add_word(kw, tuple(refs))
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def _cached(self, rule: InterventionRule) -> _CachedRule:
+        cached = self._rule_cache.get(rule.rule_id)
+        if cached is None:
+            cached = (
+                rule.domain.lower() if rule.domain else None,
+                tuple(kw.lower() for kw in rule.keyword_includes),
+                tuple(kw.lower() for kw in rule.keyword_excludes),
+            )
+            self._rule_cache[rule.rule_id] = cached
+        return cached
+
+    def compile_rules(self, profile: UserProfile) -> CompiledRules:
+        """Return (building if needed) the profile's compiled rules."""
+        compiled = profile._compiled_rules
+        if compiled is None:
+            compiled = CompiledRules(profile.rules)
+            profile._compiled_rules = compiled
+        return compiled
+
+    def evaluate_for_profile(
+        self, content: ContentItem, profile: UserProfile
+    ) -> Tuple[Optional[InterventionAction], Optional[InterventionRule]]:
+        """Like :meth:`evaluate_rules`, but against the compiled cache.
+
+        Entries are priority-sorted, so the first match is the winner.
+        """
+        title_lower = content.title_lower
+        domain_lower = content.domain.lower()
+        for rule, domain, includes, excludes in self.compile_rules(profile).entries:
+            if rule.content_type is not None and rule.content_type != content.content_type:
+                continue
+            if domain is not None and not domain_lower.endswith(domain):
+                continue
+            if excludes and any(kw in title_lower for kw in excludes):
+                continue
+            if includes and not any(kw in title_lower for kw in includes):
+                continue
+            return rule.action, rule
+        return None, None
+
+    def evaluate_rules(
+        self, content: ContentItem, rules: List[InterventionRule]
+    ) -> Tuple[Optional[InterventionAction], Optional[InterventionRule]]:
+        """Return the action and rule of the highest-priority matching rule.
+
+        Returns ``(None, None)`` when no active rule matches.
+
+        When ``rules`` is the list last passed to :meth:`index_rules`,
+        only candidates surfaced by the inverted index are checked.
+        """
+        title_lower = content.title_lower
+        domain_lower = content.domain.lower()
+        best_rule: Optional[InterventionRule] = None
+        best_priority = 0
+        if rules is self._indexed_from and self._automaton is not None:
+            # One pass over the title resolves every keyword, so the
+            # per-candidate check below is domain/type/exclude only.
+            include_hits: Set[str] = set()
+            exclude_hits: Set[str] = set()
+            for _, refs in self._automaton.iter(title_lower):
+                for rule_id, is_include in refs:
+                    (include_hits if is_include else exclude_hits).add(rule_id)
+            candidate_ids = self._no_include_rules | include_hits
+            # The indexed-rules dict preserves the original list order,
+            # so the strict > below resolves priority ties to the
+            # first-listed rule, exactly like max() on the plain scan.
+            for rule_id, rule in self._indexed_rules.items():
+                if rule_id not in candidate_ids or rule_id in exclude_hits:
+                    continue
+                if (
+                    rule.content_type is not None
+                    and rule.content_type != content.content_type
+                ):
+                    continue
+                domain, _, _ = self._cached(rule)
+                if domain is not None and not domain_lower.endswith(domain):
+                    continue
+                if best_rule is None or rule.priority > best_priority:
+                    best_rule, best_priority = rule, rule.priority
+        elif rules is self._prepared_from or rules is self._prepared:
+            # Prepared lists are priority-sorted: first match wins.
+            for rule in self._prepared:
+                if self._matches(rule, content, title_lower, domain_lower):
+                    return rule.action, rule
+            return None, None
+        else:
+            if rules is self._indexed_from:
+                # One substring test per distinct include keyword (not
+                # per rule), so candidate generation keeps the plain
+                # scan's substring semantics.
+                candidate_ids: Set[str] = set(self._no_include_rules)
+                for kw, hits in self._include_index.items():
+                    if kw in title_lower:
+                        candidate_ids |= hits
+                # Filter the ordered dict rather than iterating the set:
+                # candidates come out in list order, keeping ties
+                # deterministic (first-listed rule wins, like max()).
+                candidates = [
+                    rule
+                    for rule_id, rule in self._indexed_rules.items()
+                    if rule_id in candidate_ids
+                ]
+            else:
+                candidates = [r for r in rules if r.is_active]
+            for rule in candidates:
+                if self._matches(rule, content, title_lower, domain_lower):
+                    if best_rule is None or rule.priority > best_priority:
+                        best_rule, best_priority = rule, rule.priority
+        if best_rule is None:
+            return None, None
+        return best_rule.action, best_rule
+
+    def evaluate_rules_batch(
+        self,
+        contents: List[ContentItem],
+        rules: List[InterventionRule],
+        n_workers: Optional[int] = None,
+    ) -> List[Tuple[Optional[InterventionAction], Optional[InterventionRule]]]:
+        """Evaluate many content items against one rule set.
+
+        Large batches are split across a process pool, each worker
+        indexing the rules once; small batches are evaluated serially
+        against the in-process index, where pool startup would dominate.
+        """
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        if len(contents) < _MIN_PARALLEL_BATCH or n_workers <= 1:
+            if rules is not self._indexed_from:
+                self.index_rules(rules)
+            return [self.evaluate_rules(content, rules) for content in contents]
+
+        chunk_size = -(-len(contents) // n_workers)
+        chunks = [
+            (rules, contents[start : start + chunk_size])
+            for start in range(0, len(contents), chunk_size)
+        ]
+        results: List[
+            Tuple[Optional[InterventionAction], Optional[InterventionRule]]
+        ] = []
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            for chunk_result in executor.map(_evaluate_chunk, chunks):
+                results.extend(chunk_result)
+        return results
+
+    def get_matching_rules(
+        self, content: ContentItem, rules: List[InterventionRule]
+    ) -> List[InterventionRule]:
+        """Return every active matching rule, highest priority first."""
+        title_lower = content.title_lower
+        domain_lower = content.domain.lower()
+        matching = [
+            r
+            for r in rules
+            if r.is_active and self._matches(r, content, title_lower, domain_lower)
+        ]
+        return sorted(matching, key=lambda r: r.priority, reverse=True)
+
+    def get_top_k_matching_rules(
+        self, content: ContentItem, rules: List[InterventionRule], k: int = 5
+    ) -> List[InterventionRule]:
+        """The ``k`` highest-priority matching rules, best first.
+
+        Ranked-display callers rarely need more than a handful, and
+        ``heapq.nlargest`` is O(n log k) versus the O(n log n) full sort
+        in :meth:`get_matching_rules`.
+        """
+        title_lower = content.title_lower
+        domain_lower = content.domain.lower()
+        return heapq.nlargest(
+            k,
+            (
+                r
+                for r in rules
+                if r.is_active and self._matches(r, content, title_lower, domain_lower)
+            ),
+            key=lambda r: r.priority,
+        )
+
+    def validate_rule(self, rule: InterventionRule) -> bool:
+        """A rule must constrain at least one axis to be meaningful."""
+        # Called whenever a rule is created or updated, so any stale
+        # lowercase cache entry for this id is dropped here.
+        self._rule_cache.pop(rule.rule_id, None)
+        return bool(
+            rule.domain
+            or rule.content_type is not None
+            or rule.keyword_includes
+            or rule.keyword_excludes
+        )
+
+    def _rule_matches(self, rule: InterventionRule, content: ContentItem) -> bool:
+        """Single-rule convenience wrapper around :meth:`_matches`."""
+        return self._matches(
+            rule, content, content.title_lower, content.domain.lower()
+        )
+
+    def _matches(
+        self,
+        rule: InterventionRule,
+        content: ContentItem,
+        title_lower: str,
+        domain_lower: str,
+    ) -> bool:
+        # Cheapest and most selective predicates first: enum identity,
+        # then the domain suffix, then excludes (fast rejection), with
+        # the include-keyword scan last.
+        domain, includes, excludes = self._cached(rule)
+        if rule.content_type is not None and rule.content_type != content.content_type:
+            return False
+        if domain is not None and not domain_lower.endswith(domain):
+            return False
+        if excludes and any(kw in title_lower for kw in excludes):
+            return False
+        if includes and not any(kw in title_lower for kw in includes):
+            return False
+        return True
@@ -0,0 +1,221 @@
+"""Schemas shared across the Phaethon pipeline.
+
+Two tiers: configuration-ish models that cross the API boundary or
+need field validation stay on pydantic; the hot per-content schemas
+constructed on every evaluation (:class:`ContentItem` and friends,
+:class:`EventLog`) are msgspec Structs, whose C-level construction is
+an order of magnitude cheaper than BaseModel.
+"""
+
+import time
+import uuid
+from datetime import datetime
+from functools import cached_property
+from enum import Enum
+from typing import Any, Dict, List, Optional, Sequence
+
+import msgspec
+from pydantic import BaseModel, Field, PrivateAttr, field_serializer
+
+
+def _new_id() -> str:
+    return str(uuid.uuid4())
+
+
+def _now_us() -> int:
+    return time.time_ns() // 1000
+
+
+class ContentType(str, Enum):
+    ARTICLE = "article"
+    VIDEO = "video"
+    SOCIAL_POST = "social_post"
+    EMAIL = "email"
+    NOTIFICATION = "notification"
+    OTHER = "other"
+
+
+class InterventionAction(str, Enum):
+    ALLOW = "allow"
+    ALLOW_PRIORITIZE = "allow_prioritize"
+    WARN = "warn"
+    DELAY = "delay"
+    BLOCK = "block"
+
+
+class FeedbackType(str, Enum):
+    EXPLICIT = "explicit"
+    IMPLICIT = "implicit"
+
+
+class EventLevel(str, Enum):
+    DEBUG = "debug"
+    INFO = "info"
+    WARNING = "warning"
+    ERROR = "error"
+
+
+# value -> member tables so hot-path coercion is one dict hit instead
+# of the str-enum _missing_/__new__ machinery.
+CONTENT_TYPE_LOOKUP = {m.value: m for m in ContentType}
+ACTION_LOOKUP = {m.value: m for m in InterventionAction}
+
+
+class ContentMetadata(msgspec.Struct, kw_only=True):
+    """Optional publisher-supplied metadata attached to a content item."""
+
+    author: Optional[str] = None
+    published_at: Optional[datetime] = None
+    word_count: Optional[int] = None
+    topics: List[str] = msgspec.field(default_factory=list)
+
+
+class ContentFeatures(msgspec.Struct, kw_only=True):
+    """Features derived from a content item by the extractor."""
+
+    main_topics: List[str] = msgspec.field(default_factory=list)
+    tone: str = "neutral"
+    emotional_valence: float = 0.0
+    is_clickbait: bool = False
+    is_promotional: bool = False
+
+
+class ContentItem(msgspec.Struct, kw_only=True, dict=True):
+    """A single piece of content to be evaluated.
+
+    Constructed for every evaluated item, so it is a Struct; inputs are
+    validated at the API boundary before construction. ``dict=True``
+    gives instances a ``__dict__`` so :attr:`title_lower` can memoize.
+    """
+
+    title: str
+    domain: str
+    content_id: str = msgspec.field(default_factory=_new_id)
+    url: Optional[str] = None
+    content_type: ContentType = ContentType.OTHER
+    metadata: ContentMetadata = msgspec.field(default_factory=ContentMetadata)
+    extracted_features: Optional[ContentFeatures] = None
+    timestamp: datetime = msgspec.field(default_factory=datetime.utcnow)
+
+    @cached_property
+    def title_lower(self) -> str:
+        """Lowercased title, computed once and shared by every consumer."""
+        return self.title.lower()
+
+
+class ScoringResult(BaseModel):
+    """Output of the content scorer for one item."""
+
+    content_id: str
+    alignment_score: float = Field(ge=0.0, le=1.0)
+    value_alignments: Dict[str, float] = Field(default_factory=dict)
+    productivity_impact: float = Field(ge=-1.0, le=1.0)
+    wellbeing_impact: float = Field(ge=-1.0, le=1.0)
+    recommended_action: InterventionAction = InterventionAction.ALLOW
+    confidence: float = Field(default=0.5, ge=0.0, le=1.0)
+    reasoning: List[str] = Field(default_factory=list)
+    # Epoch microseconds: a result is built per evaluated item, so the
+    # hot path stores a cheap int and ISO only materializes on dump.
+    timestamp: int = Field(default_factory=_now_us)
+
+    @field_serializer("timestamp")
+    def _timestamp_iso(self, value: int) -> str:
+        return datetime.utcfromtimestamp(value / 1_000_000).isoformat()
+
+
+class InterventionRule(BaseModel):
+    """A user-authored rule overriding scored decisions."""
+
+    rule_id: str = Field(default_factory=_new_id)
+    domain: Optional[str] = None
+    content_type: Optional[ContentType] = None
+    keyword_includes: List[str] = Field(default_factory=list)
+    keyword_excludes: List[str] = Field(default_factory=list)
+    action: InterventionAction = InterventionAction.WARN
+    priority: int = 0
+    reason: Optional[str] = None
+    is_active: bool = True
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class InterventionDecision(BaseModel):
+    """The final decision made for one content item."""
+
+    decision_id: str = Field(default_factory=_new_id)
+    content_id: str
+    user_id: str
+    action: InterventionAction
+    scores: Optional[ScoringResult] = None
+    # Sequence (not List) so the no-match path can share one empty tuple.
+    applied_rules: Sequence[Dict[str, Any]] = Field(default_factory=tuple)
+    reasoning: List[str] = Field(default_factory=list)
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
+
+
+class UserFeedback(BaseModel):
+    """Explicit or implicit feedback on a decision or content item."""
+
+    feedback_id: str = Field(default_factory=_new_id)
+    user_id: str
+    content_id: Optional[str] = None
+    decision_id: Optional[str] = None
+    feedback_type: FeedbackType = FeedbackType.EXPLICIT
+    rating: Optional[int] = Field(default=None, ge=-1, le=1)
+    comment: Optional[str] = None
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
+
+
+class ValueProfile(BaseModel):
+    """A user's estimated value weights, category -> dimension -> weight."""
+
+    values: Dict[str, Dict[str, float]] = Field(default_factory=dict)
+    confidence: float = Field(default=0.3, ge=0.0, le=1.0)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class UserPreferences(BaseModel):
+    """How assertively Phaethon should intervene for this user."""
+
+    enable_implicit_feedback: bool = True
+    intervention_aggressiveness: float = Field(default=0.5, ge=0.0, le=1.0)
+    quiet_hours_start: Optional[int] = Field(default=None, ge=0, le=23)
+    quiet_hours_end: Optional[int] = Field(default=None, ge=0, le=23)
+
+
+class SystemSettings(BaseModel):
+    logging_enabled: bool = True
+    retention_days: int = 90
+
+
+class UserProfile(BaseModel):
+    """Everything Phaethon knows about one user."""
+
+    user_id: str
+    values: ValueProfile = Field(default_factory=ValueProfile)
+    rules: List[InterventionRule] = Field(default_factory=list)
+    # Opaque compiled-rule structure owned by the RulesEngine; rebuilt
+    # lazily whenever the profile (and thus its rules list) is reloaded.
+    _compiled_rules: Optional[Any] = PrivateAttr(default=None)
+    # Cached scoring-weight vector owned by the ContentScorer; reset
+    # alongside _compiled_rules whenever the profile is saved/reloaded.
+    _value_weights: Optional[Any] = PrivateAttr(default=None)
+    preferences: UserPreferences = Field(default_factory=UserPreferences)
+    settings: SystemSettings = Field(default_factory=SystemSettings)
+    total_content_processed: int = 0
+    total_decisions_made: int = 0
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class EventLog(msgspec.Struct, kw_only=True):
+    """One row in the append-only event log."""
+
+    event_type: str
+    message: str
+    event_id: str = msgspec.field(default_factory=_new_id)
+    user_id: Optional[str] = None
+    level: EventLevel = EventLevel.INFO
+    metadata: Dict[str, Any] = msgspec.field(default_factory=dict)
+    # Epoch microseconds: events are written far more often than read,
+    # so the log never pays datetime construction on the hot path.
+    timestamp_us: int = msgspec.field(default_factory=_now_us)
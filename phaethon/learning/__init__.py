@@ -0,0 +1 @@
+"""Learning layer: value estimation, behavior analysis, feedback."""
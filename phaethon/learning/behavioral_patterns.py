@@ -0,0 +1,325 @@
+"""Analysis of engagement history for behavioral patterns.
+
+Engagement events are plain dicts with a known shape: ``timestamp``
+(datetime), ``engagement_score`` (float), ``time_spent`` (seconds),
+``content_type``, ``domain``, and optional ``topics``.
+"""
+
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Tuple, Union
+
+import numpy as np
+
+
+class _Interner:
+    """Maps strings to stable small ints, with reverse lookup.
+
+    Integer ids hash and compare in one step where the original strings
+    cost length + contents, and they stay stable across histories so
+    array views built at different times can be concatenated.
+    """
+
+    __slots__ = ("_ids", "_strings")
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._strings: List[str] = []
+
+    def intern(self, value: str) -> int:
+        sid = self._ids.get(value)
+        if sid is None:
+            sid = self._ids[value] = len(self._strings)
+            self._strings.append(value)
+        return sid
+
+    def value(self, sid: int) -> str:
+        return self._strings[sid]
+
+    def snapshot(self) -> Tuple[str, ...]:
+        return tuple(self._strings)
+
+
+CONTENT_TYPE_INTERNER = _Interner()
+DOMAIN_INTERNER = _Interner()
+
+
+@dataclass(slots=True)
+class EngagementHistoryArrays:
+    """Column-oriented (struct-of-arrays) view of an engagement history.
+
+    Converting once with :meth:`from_events` lets the analyzers run as
+    array reductions instead of per-event dict lookups. Missing fields
+    are encoded as NaT (timestamps) or -1 (hour and id columns);
+    ``content_types``/``domains`` map ids back to strings.
+    """
+
+    timestamps: np.ndarray  # datetime64[us], NaT when absent
+    hours: np.ndarray  # int8, -1 when timestamp absent
+    engagement_scores: np.ndarray  # float64
+    time_spent: np.ndarray  # float64
+    content_type_ids: np.ndarray  # int16, -1 when absent
+    domain_ids: np.ndarray  # int32, -1 when absent
+    content_types: Tuple[str, ...]
+    domains: Tuple[str, ...]
+
+    @classmethod
+    def from_events(cls, events: List[Dict[str, Any]]) -> "EngagementHistoryArrays":
+        n = len(events)
+        timestamps = np.full(n, np.datetime64("NaT"), dtype="datetime64[us]")
+        hours = np.full(n, -1, dtype=np.int8)
+        scores = np.empty(n, dtype=np.float64)
+        time_spent = np.zeros(n, dtype=np.float64)
+        content_type_ids = np.full(n, -1, dtype=np.int16)
+        domain_ids = np.full(n, -1, dtype=np.int32)
+        intern_content_type = CONTENT_TYPE_INTERNER.intern
+        intern_domain = DOMAIN_INTERNER.intern
+        for i, event in enumerate(events):
+            timestamp = event.get("timestamp")
+            if timestamp is not None:
+                timestamps[i] = np.datetime64(timestamp)
+                hours[i] = timestamp.hour
+            scores[i] = event.get("engagement_score", 0.5)
+            time_spent[i] = event.get("time_spent", 0)
+            content_type = event.get("content_type")
+            if content_type is not None:
+                content_type_ids[i] = intern_content_type(content_type)
+            domain = event.get("domain")
+            if domain is not None:
+                domain_ids[i] = intern_domain(domain)
+        return cls(
+            timestamps=timestamps,
+            hours=hours,
+            engagement_scores=scores,
+            time_spent=time_spent,
+            content_type_ids=content_type_ids,
+            domain_ids=domain_ids,
+            content_types=CONTENT_TYPE_INTERNER.snapshot(),
+            domains=DOMAIN_INTERNER.snapshot(),
+        )
+
+
+History = Union[List[Dict[str, Any]], EngagementHistoryArrays]
+
+# int64 view of NaT: events without a timestamp count as in-window.
+_NAT_I64 = np.datetime64("NaT").astype(np.int64)
+
+
+def _time_window_mask(
+    timestamps: np.ndarray, now_us: int, window_minutes: int
+) -> np.ndarray:
+    """In-window mask over datetime64[us] timestamps via integer compares."""
+    as_i64 = timestamps.astype(np.int64, copy=False)
+    window_start_us = now_us - window_minutes * 60_000_000
+    return (as_i64 >= window_start_us) | (as_i64 == _NAT_I64)
+
+
+def _grouped_means(
+    ids: np.ndarray, scores: np.ndarray, labels: Tuple[str, ...]
+) -> Dict[str, float]:
+    """Average ``scores`` grouped by non-negative ``ids``."""
+    mask = ids >= 0
+    if not mask.any():
+        return {}
+    ids = ids[mask]
+    sums = np.bincount(ids, weights=scores[mask], minlength=len(labels))
+    counts = np.bincount(ids, minlength=len(labels))
+    observed = np.flatnonzero(counts)
+    means = sums[observed] / counts[observed]
+    return {labels[i]: float(mean) for i, mean in zip(observed, means)}
+
+
+def _accumulate(acc: Dict[Any, List[float]], key: Any, score: float) -> None:
+    entry = acc.get(key)
+    if entry is None:
+        acc[key] = [score, 1]
+    else:
+        entry[0] += score
+        entry[1] += 1
+
+
+def _averages(acc: Dict[Any, List[float]]) -> Dict[Any, float]:
+    return {key: total / count for key, (total, count) in acc.items()}
+
+
+class BehavioralAnalyzer:
+    """Derives usage patterns from a user's engagement history."""
+
+    def analyze_time_of_day_patterns(self, engagement_history: History) -> Dict[int, float]:
+        """Average engagement score per hour of day (0-23).
+
+        Hours are binned with two ``np.bincount`` passes (score sums and
+        event counts), so large histories cost two C loops instead of a
+        Python dict-of-lists build. Only observed hours appear in the
+        result, as before.
+        """
+        if isinstance(engagement_history, EngagementHistoryArrays):
+            mask = engagement_history.hours >= 0
+            hours = engagement_history.hours[mask]
+            scores = engagement_history.engagement_scores[mask]
+        else:
+            hours = np.fromiter(
+                (
+                    event["timestamp"].hour
+                    for event in engagement_history
+                    if "timestamp" in event
+                ),
+                dtype=np.int8,
+            )
+            scores = np.fromiter(
+                (
+                    event.get("engagement_score", 0.5)
+                    for event in engagement_history
+                    if "timestamp" in event
+                ),
+                dtype=np.float64,
+                count=hours.size,
+            )
+        if hours.size == 0:
+            return {}
+        sums = np.bincount(hours, weights=scores, minlength=24)
+        counts = np.bincount(hours, minlength=24)
+        observed = np.flatnonzero(counts)
+        means = sums[observed] / counts[observed]
+        return {int(hour): float(mean) for hour, mean in zip(observed, means)}
+
+    def analyze_all_patterns(
+        self, engagement_history: List[Dict[str, Any]]
+    ) -> Tuple[Dict[int, float], Dict[str, float], Dict[str, float]]:
+        """Hourly, content-type, and domain averages from one pass.
+
+        Callers that need all three views should prefer this over the
+        individual methods: the history (often the largest structure in
+        the process) is walked once with (sum, count) accumulators
+        instead of three times.
+        """
+        by_hour: Dict[int, List[float]] = {}
+        by_type: Dict[str, List[float]] = {}
+        by_domain: Dict[str, List[float]] = {}
+        for event in engagement_history:
+            score = event.get("engagement_score", 0.5)
+            timestamp = event.get("timestamp")
+            if timestamp is not None:
+                _accumulate(by_hour, timestamp.hour, score)
+            content_type = event.get("content_type")
+            if content_type is not None:
+                _accumulate(by_type, content_type, score)
+            domain = event.get("domain")
+            if domain is not None:
+                _accumulate(by_domain, domain, score)
+        return _averages(by_hour), _averages(by_type), _averages(by_domain)
+
+    def analyze_content_type_preferences(
+        self, engagement_history: History
+    ) -> Dict[str, float]:
+        """Average engagement score per content type."""
+        if isinstance(engagement_history, EngagementHistoryArrays):
+            return _grouped_means(
+                engagement_history.content_type_ids,
+                engagement_history.engagement_scores,
+                engagement_history.content_types,
+            )
+        by_type: Dict[str, List[float]] = {}
+        for event in engagement_history:
+            content_type = event.get("content_type")
+            if content_type is not None:
+                _accumulate(by_type, content_type, event.get("engagement_score", 0.5))
+        return _averages(by_type)
+
+    def analyze_domain_preferences(
+        self, engagement_history: History
+    ) -> Dict[str, float]:
+        """Average engagement score per domain."""
+        if isinstance(engagement_history, EngagementHistoryArrays):
+            return _grouped_means(
+                engagement_history.domain_ids,
+                engagement_history.engagement_scores,
+                engagement_history.domains,
+            )
+        by_domain: Dict[str, List[float]] = {}
+        for event in engagement_history:
+            domain = event.get("domain")
+            if domain is not None:
+                _accumulate(by_domain, domain, event.get("engagement_score", 0.5))
+        return _averages(by_domain)
+
+    def identify_distraction_triggers(
+        self,
+        engagement_history: List[Dict[str, Any]],
+        goal_topics: List[str],
+    ) -> Dict[str, int]:
+        """Count off-goal visits per domain.
+
+        An event counts as a distraction when none of its topics overlap
+        the user's stated goal topics.
+        """
+        goal_set = frozenset(topic.lower() for topic in goal_topics)
+        domain_trigger_count: Dict[str, int] = defaultdict(int)
+        for event in engagement_history:
+            event_topics = event.get("topics", [])
+            if not event_topics:
+                continue
+            if any(topic.lower() in goal_set for topic in event_topics):
+                continue
+            domain = event.get("domain")
+            if domain:
+                domain_trigger_count[domain] += 1
+        return dict(domain_trigger_count)
+
+    def detect_attention_fragmentation(
+        self,
+        engagement_history: History,
+        window_minutes: int = 60,
+    ) -> Dict[str, float]:
+        """Measure how fragmented attention was in the recent window.
+
+        Fragmentation is high when many items were touched briefly.
+        """
+        if isinstance(engagement_history, EngagementHistoryArrays):
+            # Integer clock: no datetime allocation on the array path.
+            in_window = _time_window_mask(
+                engagement_history.timestamps, time.time_ns() // 1000, window_minutes
+            )
+            count = int(in_window.sum())
+            if count == 0:
+                return {
+                    "fragmentation_score": 0.0,
+                    "items_in_window": 0,
+                    "avg_time_spent": 0.0,
+                }
+            spent = engagement_history.time_spent[in_window]
+            return {
+                "fragmentation_score": float((spent < 30).sum()) / count,
+                "items_in_window": count,
+                "avg_time_spent": float(spent.sum()) / count,
+            }
+
+        now = datetime.utcnow()
+        window_start = now - timedelta(minutes=window_minutes)
+        # One pass: total time, item count, and short touches together,
+        # with no materialized in-window list.
+        total_time = 0.0
+        count = 0
+        short_touches = 0
+        for event in engagement_history:
+            if event.get("timestamp", now) < window_start:
+                continue
+            time_spent = event.get("time_spent", 0)
+            total_time += time_spent
+            count += 1
+            # Many short touches -> fragmented. 30s is the "glance" threshold.
+            if time_spent < 30:
+                short_touches += 1
+        if count == 0:
+            return {"fragmentation_score": 0.0, "items_in_window": 0, "avg_time_spent": 0.0}
+
+        avg_time = total_time / count
+        fragmentation = short_touches / count
+
+        return {
+            "fragmentation_score": fragmentation,
+            "items_in_window": count,
+            "avg_time_spent": avg_time,
+        }
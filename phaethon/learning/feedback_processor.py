@@ -0,0 +1,148 @@
+"""Turning raw user interactions into feedback signals."""
+
+from bisect import bisect
+from typing import Any, Dict, List
+
+import numpy as np
+
+from ..core.schemas import UserFeedback, ValueProfile
+
+
+# Dwell-time thresholds flattened into a bucket table: bisect over the
+# edges replaces the threshold cascade, and the edges are >=-inclusive
+# like the original comparisons.
+_TIME_EDGES = (5.0, 30.0, 120.0, 600.0)
+_TIME_SIGNALS = (
+    ("implicit_disagree", 0.4),
+    ("neutral", 0.5),
+    ("implicit_agree", 0.6),
+    ("implicit_agree", 0.75),
+    ("implicit_agree", 0.9),
+)
+
+_ACTION_SIGNALS = {
+    "dismissed": ("implicit_disagree", 0.8),
+    "shared": ("implicit_agree", 0.9),
+    "clicked": ("implicit_agree", 0.55),
+}
+_NEUTRAL_SIGNAL = ("neutral", 0.5)
+
+
+class FeedbackProcessor:
+    """Interprets explicit and implicit feedback."""
+
+    def process_implicit_feedback(
+        self, user_id: str, content_id: str, action: str, time_spent: float = 0.0
+    ) -> Dict[str, Any]:
+        """Map an observed interaction to an implicit feedback signal.
+
+        ``action`` is what the user did ("spent_time", "dismissed",
+        "clicked", "shared"); ``time_spent`` is seconds, only meaningful
+        for "spent_time".
+        """
+        if action == "spent_time":
+            signal, confidence = _TIME_SIGNALS[bisect(_TIME_EDGES, time_spent)]
+        else:
+            signal, confidence = _ACTION_SIGNALS.get(action, _NEUTRAL_SIGNAL)
+
+        return {
+            "user_id": user_id,
+            "content_id": content_id,
+            "signal": signal,
+            "confidence": confidence,
+        }
+
+    def aggregate_feedback_signal(
+        self, feedbacks: List[UserFeedback]
+    ) -> Dict[str, float]:
+        """Collapse a batch of ratings into one direction + confidence.
+
+        The mean and (population) standard deviation come out of numpy
+        reductions over one ratings array rather than two Python passes
+        over the list.
+        """
+        ratings = np.fromiter(
+            (f.rating for f in feedbacks if f.rating is not None),
+            dtype=np.float64,
+        )
+        if ratings.size == 0:
+            return {"direction": 0.0, "confidence": 0.0}
+        direction = float(np.sign(ratings.mean()))
+        confidence = max(0.0, 1.0 - float(ratings.std()) / 2)
+        return {"direction": direction, "confidence": confidence}
+
+    def aggregate_many(
+        self, feedbacks_by_user: Dict[str, List[UserFeedback]]
+    ) -> Dict[str, Dict[str, float]]:
+        """Aggregate several users' feedback batches in shared passes.
+
+        All ratings are concatenated into one buffer and per-user sums
+        and squared sums are carved out with ``np.add.reduceat`` over
+        the segment offsets, so adding users costs indexed loads, not
+        another Python reduction each.
+        """
+        user_ids: List[str] = []
+        offsets: List[int] = []
+        flat: List[float] = []
+        for user_id, feedbacks in feedbacks_by_user.items():
+            user_ids.append(user_id)
+            offsets.append(len(flat))
+            flat.extend(f.rating for f in feedbacks if f.rating is not None)
+
+        n_users = len(user_ids)
+        ratings = np.asarray(flat, dtype=np.float64)
+        offs = np.asarray(offsets, dtype=np.intp)
+        counts = np.diff(np.append(offs, ratings.size))
+        sums = np.zeros(n_users)
+        sq_sums = np.zeros(n_users)
+        nonempty = counts > 0
+        if ratings.size:
+            # Empty segments are skipped: reduceat between consecutive
+            # non-empty offsets covers exactly one user's ratings.
+            ne_offs = offs[nonempty]
+            sums[nonempty] = np.add.reduceat(ratings, ne_offs)
+            sq_sums[nonempty] = np.add.reduceat(ratings * ratings, ne_offs)
+
+        safe_counts = np.maximum(counts, 1)
+        means = sums / safe_counts
+        variances = np.maximum(sq_sums / safe_counts - means * means, 0.0)
+        confidences = np.where(
+            nonempty, np.maximum(0.0, 1.0 - np.sqrt(variances) / 2), 0.0
+        )
+        directions = np.where(nonempty, np.sign(means), 0.0)
+        return {
+            user_id: {
+                "direction": float(directions[i]),
+                "confidence": float(confidences[i]),
+            }
+            for i, user_id in enumerate(user_ids)
+        }
+
+    def detect_user_goal_drift(
+        self, value_history: List[ValueProfile], threshold: float = 0.2
+    ) -> Dict[str, Any]:
+        """Detect whether value weights moved materially over the history."""
+        if len(value_history) < 2:
+            return {"drift_detected": False, "max_change": 0.0}
+        old_values = value_history[0].values
+        new_values = value_history[-1].values
+        # Flatten the dimensions both profiles share, then take the max
+        # absolute difference as one array reduction instead of a nested
+        # dict walk with per-dimension abs/compare.
+        old_flat: List[float] = []
+        new_flat: List[float] = []
+        for category, old_dims in old_values.items():
+            new_dims = new_values.get(category)
+            if not new_dims:
+                continue
+            for dim, score in old_dims.items():
+                new_score = new_dims.get(dim)
+                if new_score is not None:
+                    old_flat.append(score)
+                    new_flat.append(new_score)
+        if not old_flat:
+            return {"drift_detected": False, "max_change": 0.0}
+        max_change = float(
+            np.abs(np.asarray(new_flat) - np.asarray(old_flat)).max()
+        )
+        return {"drift_detected": max_change >= threshold, "max_change": max_change}
@@ -0,0 +1,159 @@
+"""Bayesian-flavoured estimation of a user's value weights from feedback."""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import orjson
+
+from .. import config
+from ..core.schemas import UserFeedback, ValueProfile
+
+# Below this many dimensions the plain Python loop beats the cost of
+# building an ndarray; above it, one vectorized clip wins.
+_VECTORIZE_MIN_DIMS = 50
+
+
+def _scale_values(
+    values: Dict[str, Dict[str, float]], factor: float
+) -> Dict[str, Dict[str, float]]:
+    """Multiply every dimension by ``factor``, clamped to [0, 1]."""
+    total_dims = sum(len(dims) for dims in values.values())
+    if total_dims >= _VECTORIZE_MIN_DIMS:
+        flat = np.fromiter(
+            (score for dims in values.values() for score in dims.values()),
+            dtype=np.float64,
+            count=total_dims,
+        )
+        scaled = iter(np.clip(flat * factor, 0.0, 1.0).tolist())
+        return {
+            category: {dim: next(scaled) for dim in dims}
+            for category, dims in values.items()
+        }
+    scaled: Dict[str, Dict[str, float]] = {}
+    for category, dims in values.items():
+        out = scaled[category] = {}
+        for dim, score in dims.items():
+            new_score = score * factor
+            # Inline clamp: branch prediction beats two builtin calls
+            # (max/min) per dimension on this hot loop.
+            if new_score < 0.0:
+                new_score = 0.0
+            elif new_score > 1.0:
+                new_score = 1.0
+            out[dim] = new_score
+    return scaled
+
+
+class BayesianValuesEstimator:
+    """Maintains a per-user :class:`ValueProfile` updated from feedback.
+
+    Positive feedback on allowed content confirms the current weights and
+    lets them relax toward the floor; negative feedback pushes weights up
+    so the affected dimensions exert more influence on future scoring.
+    """
+
+    POSITIVE_FACTOR = 0.95
+    NEGATIVE_FACTOR = 1.05
+    CONFIDENCE_STEP = 0.01
+    MAX_CONFIDENCE = 0.95
+
+    def default_profile(self) -> ValueProfile:
+        """A fresh profile seeded from the default hierarchy."""
+        values = {
+            category: {dim: config.DEFAULT_VALUE_WEIGHT for dim in dims}
+            for category, dims in config.DEFAULT_VALUE_HIERARCHY.items()
+        }
+        return ValueProfile(values=values)
+
+    def update_from_feedback(
+        self, current_values: ValueProfile, feedback: UserFeedback
+    ) -> ValueProfile:
+        """Return a new profile adjusted by one piece of feedback."""
+        if feedback.rating is None:
+            return current_values
+
+        confidence = min(
+            self.MAX_CONFIDENCE, current_values.confidence + self.CONFIDENCE_STEP
+        )
+        if feedback.rating == 0:
+            # Neutral feedback changes no weights; skip the O(dims) copy
+            # and only bump confidence.
+            return ValueProfile(
+                values=current_values.values,
+                confidence=confidence,
+                updated_at=datetime.utcnow(),
+            )
+
+        factor = self.POSITIVE_FACTOR if feedback.rating == 1 else self.NEGATIVE_FACTOR
+        return ValueProfile(
+            values=_scale_values(current_values.values, factor),
+            confidence=confidence,
+            updated_at=datetime.utcnow(),
+        )
+
+    def update_from_feedback_batch(
+        self, current_values: ValueProfile, feedback_list: List[UserFeedback]
+    ) -> ValueProfile:
+        """Apply a queue of feedback as one collapsed update.
+
+        N multiplicative updates reduce to a single factor
+        ``POSITIVE_FACTOR**pos * NEGATIVE_FACTOR**neg``, so the values
+        dict is rebuilt once instead of once per feedback. Clamping
+        happens at the end, which only matters for batches extreme
+        enough to pin a weight to 0 or 1 mid-sequence.
+        """
+        ratings = [f.rating for f in feedback_list if f.rating is not None]
+        if not ratings:
+            return current_values
+        pos = sum(1 for rating in ratings if rating == 1)
+        neg = sum(1 for rating in ratings if rating == -1)
+        confidence = min(
+            self.MAX_CONFIDENCE,
+            current_values.confidence + self.CONFIDENCE_STEP * len(ratings),
+        )
+        factor = (self.POSITIVE_FACTOR ** pos) * (self.NEGATIVE_FACTOR ** neg)
+        values = (
+            current_values.values
+            if factor == 1.0
+            else _scale_values(current_values.values, factor)
+        )
+        return ValueProfile(
+            values=values, confidence=confidence, updated_at=datetime.utcnow()
+        )
+
+    def get_value_confidence_intervals(
+        self, profile: ValueProfile
+    ) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Crude symmetric intervals that narrow as confidence grows."""
+        half_width = (1.0 - profile.confidence) / 2
+        values = profile.values
+        total_dims = sum(len(dims) for dims in values.values())
+        flat = np.fromiter(
+            (score for dims in values.values() for score in dims.values()),
+            dtype=np.float64,
+            count=total_dims,
+        )
+        lowers = iter(np.maximum(flat - half_width, 0.0).tolist())
+        uppers = iter(np.minimum(flat + half_width, 1.0).tolist())
+        return {
+            category: {
+                dim: {"lower": next(lowers), "upper": next(uppers)} for dim in dims
+            }
+            for category, dims in values.items()
+        }
+
+    def save_values(self, user_id: str, profile: ValueProfile) -> Path:
+        """Persist a profile as JSON under the values directory."""
+        config.ensure_data_dirs()
+        file_path = config.VALUES_DIR / f"{user_id}.json"
+        file_path.write_bytes(orjson.dumps(profile.model_dump(mode="json")))
+        return file_path
+
+    def load_values(self, user_id: str) -> Optional[ValueProfile]:
+        """Load a previously saved profile, or ``None`` if absent."""
+        file_path = config.VALUES_DIR / f"{user_id}.json"
+        if not file_path.exists():
+            return None
+        return ValueProfile.model_validate(orjson.loads(file_path.read_bytes()))
@@ -0,0 +1 @@
+"""Content feature extraction and value-alignment scoring."""
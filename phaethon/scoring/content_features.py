@@ -0,0 +1,283 @@
+"""Heuristic feature extraction from content titles and domains."""
+
+import functools
+import re
+from collections import defaultdict
+from typing import Dict, List, Set
+
+from msgspec import structs
+
+try:  # optional: single-pass keyword scanning (phaethon[fastmatch])
+    import ahocorasick
+except ImportError:  # pragma: no cover - exercised only without the extra
+    ahocorasick = None
+
+from ..core.schemas import ContentFeatures, ContentItem
+
+LEARNING_DOMAINS = {
+    "arxiv.org",
+    "scholar.google.com",
+    "en.wikipedia.org",
+    "docs.python.org",
+    "coursera.org",
+    "khanacademy.org",
+    "ocw.mit.edu",
+    "stackoverflow.com",
+}
+
+_TOKEN_RE = re.compile(r"[a-z']+")
+
+# Tags whose fallback semantics are whole-token membership (frozenset
+# intersections), not substring search; automaton hits for them must
+# land on token boundaries or "best" would fire inside "bestseller".
+_TOKEN_TAGS = frozenset({"sensational", "negative", "positive"})
+
+# The character class of _TOKEN_RE: a hit is token-bounded when the
+# characters adjacent to it are not drawn from this set.
+_WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz'")
+
+DISTRACTION_DOMAINS = {
+    "twitter.com",
+    "x.com",
+    "facebook.com",
+    "instagram.com",
+    "tiktok.com",
+    "reddit.com",
+    "buzzfeed.com",
+    "9gag.com",
+}
+
+
+class ContentFeatureExtractor:
+    """Derives :class:`ContentFeatures` from a content item's title."""
+
+    TOPIC_KEYWORDS = {
+        "technology": ["software", "programming", "computer", "ai", "algorithm"],
+        "science": ["research", "study", "experiment", "physics", "biology"],
+        "health": ["fitness", "diet", "exercise", "sleep", "nutrition"],
+        "finance": ["stocks", "investing", "market", "crypto", "economy"],
+        "entertainment": ["movie", "celebrity", "gossip", "trailer", "meme"],
+        "news": ["breaking", "report", "announcement", "election", "policy"],
+    }
+
+    SENSATIONAL_WORDS = [
+        "shocking",
+        "incredible",
+        "unbelievable",
+        "insane",
+        "epic",
+        "destroyed",
+        "slams",
+    ]
+
+    EDUCATIONAL_WORDS = [
+        "how to",
+        "tutorial",
+        "guide",
+        "explained",
+        "introduction",
+        "deep dive",
+    ]
+
+    NEGATIVE_WORDS = [
+        "crisis",
+        "disaster",
+        "outrage",
+        "scandal",
+        "fear",
+        "collapse",
+        "worst",
+    ]
+
+    POSITIVE_WORDS = [
+        "progress",
+        "breakthrough",
+        "success",
+        "improved",
+        "celebrate",
+        "best",
+    ]
+
+    # Frozenset views of the single-word lists: one tokenization plus
+    # O(1) hash lookups instead of a substring scan per word, and a
+    # token can no longer match inside a longer word ("best" no longer
+    # fires on "bestseller").
+    _SENSATIONAL = frozenset(SENSATIONAL_WORDS)
+    _NEGATIVE = frozenset(NEGATIVE_WORDS)
+    _POSITIVE = frozenset(POSITIVE_WORDS)
+
+    PROMO_PHRASES = [
+        "buy now",
+        "limited time",
+        "discount",
+        "sale",
+        "sponsored",
+        "% off",
+    ]
+
+    CLICKBAIT_PATTERNS = [
+        r"doctors hate",
+        r"you won[’']?t believe",
+        r"this one weird trick",
+        r"number \d+ will shock you",
+        r"what happened next",
+    ]
+
+    # One compiled alternation: a single scan instead of five re.search
+    # calls (each paying the re-cache lookup) per title.
+    _CLICKBAIT_RE = re.compile(
+        "|".join(f"(?:{pattern})" for pattern in CLICKBAIT_PATTERNS),
+        re.IGNORECASE,
+    )
+
+    # (tag, topic) pairs precomputed so the per-title loop below does
+    # no string concatenation.
+    _TOPIC_TAGS = tuple(("topic:" + topic, topic) for topic in TOPIC_KEYWORDS)
+
+    def __init__(self):
+        # With pyahocorasick installed, every keyword list above folds
+        # into one tagged automaton so a title is scanned once instead
+        # of once per keyword.
+        self._ac = None
+        if ahocorasick is not None:
+            tags_by_keyword: Dict[str, Set[str]] = defaultdict(set)
+            for topic, keywords in self.TOPIC_KEYWORDS.items():
+                for kw in keywords:
+                    tags_by_keyword[kw].add("topic:" + topic)
+            for kw in self.SENSATIONAL_WORDS:
+                tags_by_keyword[kw].add("sensational")
+            for kw in self.EDUCATIONAL_WORDS:
+                tags_by_keyword[kw].add("educational")
+            for kw in self.NEGATIVE_WORDS:
+                tags_by_keyword[kw].add("negative")
+            for kw in self.POSITIVE_WORDS:
+                tags_by_keyword[kw].add("positive")
+            for kw in self.PROMO_PHRASES:
+                tags_by_keyword[kw].add("promo")
+            automaton = ahocorasick.Automaton()
+            for kw, tags in tags_by_keyword.items():
+                # Tags are split by matching semantics so the scan can
+                # boundary-check only the token-based ones per hit.
+                automaton.add_word(
+                    kw,
+                    (kw, tuple(tags - _TOKEN_TAGS), tuple(tags & _TOKEN_TAGS)),
+                )
+            automaton.make_automaton()
+            self._ac = automaton
+
+    def extract_features(self, content: ContentItem) -> ContentFeatures:
+        """Extract topics, tone, valence, and flags from the content title.
+
+        Results are memoized by title (features derive from the title
+        alone), so re-ingested feed items skip the whole pipeline. The
+        returned object may be the shared cached instance: treat it as
+        immutable.
+        """
+        if not content.title:
+            return ContentFeatures()
+        # The item's memoized lowercase title doubles as the cache key,
+        # so case variants of one title share an entry.
+        features = self._extract_from_title(content.title_lower)
+        if content.metadata.topics:
+            # Copy-on-extend keeps the cached instance pristine.
+            return structs.replace(
+                features,
+                main_topics=features.main_topics + content.metadata.topics,
+            )
+        return features
+
+    @functools.lru_cache(maxsize=4096)
+    def _extract_from_title(self, text_lower: str) -> ContentFeatures:
+        if self._ac is not None:
+            return self._extract_single_pass(text_lower)
+        tokens = frozenset(_TOKEN_RE.findall(text_lower))
+        return ContentFeatures(
+            main_topics=self._extract_topics(text_lower),
+            tone=self._analyze_tone(text_lower, tokens),
+            emotional_valence=self._estimate_valence(tokens),
+            is_clickbait=self._is_clickbait(text_lower),
+            is_promotional=self._is_promotional(text_lower),
+        )
+
+    def _extract_single_pass(self, text_lower: str) -> ContentFeatures:
+        """All keyword-derived features from one automaton walk.
+
+        Distinct matched keywords are collected per tag so the counts
+        match the per-keyword membership semantics of the fallback
+        helpers (repeats of one keyword count once). Token-based tags
+        only count hits flanked by non-word characters, mirroring the
+        fallback's tokenization, so both paths score identically.
+        """
+        n = len(text_lower)
+        hits: Dict[str, Set[str]] = defaultdict(set)
+        for end, (kw, free_tags, token_tags) in self._ac.iter(text_lower):
+            for tag in free_tags:
+                hits[tag].add(kw)
+            if token_tags:
+                start = end - len(kw) + 1
+                if (start and text_lower[start - 1] in _WORD_CHARS) or (
+                    end + 1 < n and text_lower[end + 1] in _WORD_CHARS
+                ):
+                    continue
+                for tag in token_tags:
+                    hits[tag].add(kw)
+        topics = [topic for tag, topic in self._TOPIC_TAGS if tag in hits]
+        if "sensational" in hits:
+            tone = "sensational"
+        elif "educational" in hits:
+            tone = "educational"
+        elif "topic:news" in hits:
+            tone = "news"
+        else:
+            tone = "neutral"
+        negative = len(hits.get("negative", ()))
+        positive = len(hits.get("positive", ()))
+        total = negative + positive
+        valence = (positive - negative) / total if total else 0.0
+        return ContentFeatures(
+            main_topics=topics,
+            tone=tone,
+            emotional_valence=valence,
+            is_clickbait=self._is_clickbait(text_lower),
+            is_promotional="promo" in hits,
+        )
+
+    def _extract_topics(self, text_lower: str) -> List[str]:
+        topics = []
+        for topic, keywords in self.TOPIC_KEYWORDS.items():
+            if any(kw in text_lower for kw in keywords):
+                topics.append(topic)
+        return topics
+
+    def _analyze_tone(self, text_lower: str, tokens: frozenset) -> str:
+        if not self._SENSATIONAL.isdisjoint(tokens):
+            return "sensational"
+        # Educational markers include multi-word phrases, so they stay
+        # on the substring path.
+        if any(w in text_lower for w in self.EDUCATIONAL_WORDS):
+            return "educational"
+        if any(w in text_lower for w in self.TOPIC_KEYWORDS["news"]):
+            return "news"
+        return "neutral"
+
+    def _estimate_valence(self, tokens: frozenset) -> float:
+        negative = len(self._NEGATIVE & tokens)
+        positive = len(self._POSITIVE & tokens)
+        total = negative + positive
+        if total == 0:
+            return 0.0
+        return (positive - negative) / total
+
+    def _is_promotional(self, text_lower: str) -> bool:
+        return any(p in text_lower for p in self.PROMO_PHRASES)
+
+    def _is_clickbait(self, text: str) -> bool:
+        if self._CLICKBAIT_RE.search(text):
+            return True
+        return text.count("!") > 3 or text.count("?") > 2
+
+
+# Shared extractor: all state (keyword structures, regexes, automaton)
+# is frozen after __init__, so one instance serves every scorer and the
+# title memo cache is shared instead of split per instance.
+EXTRACTOR = ContentFeatureExtractor()
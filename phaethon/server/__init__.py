@@ -0,0 +1 @@
+"""FastAPI server."""
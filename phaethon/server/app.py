@@ -0,0 +1,284 @@
+"""FastAPI application exposing the Phaethon evaluation API."""
+
+import logging
+import sys
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse
+from pydantic import BaseModel, Field, field_validator
+
+from ..core.decision_engine import DecisionEngine
+from ..core.schemas import (
+    CONTENT_TYPE_LOOKUP,
+    ContentItem,
+    ContentMetadata,
+    ContentType,
+    EventLevel,
+    EventLog,
+    InterventionRule,
+    UserFeedback,
+)
+from ..learning.values_estimator import BayesianValuesEstimator
+from ..storage.event_logger import EventLogger
+from ..storage.user_profiles import UserProfileManager
+from ..utils.uuidpool import UUID_POOL
+
+logger = logging.getLogger(__name__)
+
+profile_manager = UserProfileManager()
+event_logger = EventLogger()
+decision_engine = DecisionEngine()
+values_estimator = BayesianValuesEstimator()
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    yield
+    # Drain the queued event writes and pending statistics deltas
+    # before the worker exits; both are buffered off the request path.
+    event_logger.close()
+    profile_manager.flush_statistics()
+
+
+# orjson renders the response body in C instead of the default
+# json.dumps walk; every endpoint inherits it.
+app = FastAPI(
+    title="Phaethon",
+    version="0.1.0",
+    lifespan=_lifespan,
+    default_response_class=ORJSONResponse,
+)
+# Event listings and profiles are JSON with heavily repeated keys;
+# small responses skip compression via the size threshold.
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
+
+class EvaluateContentRequest(BaseModel):
+    user_id: str
+    title: str
+    domain: str
+    url: Optional[str] = None
+    content_type: ContentType = ContentType.OTHER
+    topics: List[str] = Field(default_factory=list)
+
+    @field_validator("content_type", mode="before")
+    @classmethod
+    def _coerce_content_type(cls, v):
+        # Fast path for the common case: exact enum value string. Other
+        # types (including unhashable ones) fall through to normal enum
+        # validation so bad input stays a 422, not a TypeError.
+        if isinstance(v, str):
+            return CONTENT_TYPE_LOOKUP.get(v, v)
+        return v
+
+
+class FeedbackRequest(BaseModel):
+    user_id: str
+    content_id: Optional[str] = None
+    decision_id: Optional[str] = None
+    rating: Optional[int] = Field(default=None, ge=-1, le=1)
+    comment: Optional[str] = None
+
+
+class RuleRequest(BaseModel):
+    user_id: str
+    domain: Optional[str] = None
+    content_type: Optional[ContentType] = None
+    keyword_includes: List[str] = Field(default_factory=list)
+    keyword_excludes: List[str] = Field(default_factory=list)
+    action: str = "warn"
+    priority: int = 0
+    reason: Optional[str] = None
+
+
+# Expected errors get dedicated handlers that skip logging entirely:
+# formatting a traceback per bad request is pure overhead when clients
+# loop on invalid input. Only truly unhandled exceptions pay for it.
+# The response bodies mirror FastAPI's defaults ({"detail": ...}) so
+# the wire format is unchanged.
+@app.exception_handler(HTTPException)
+async def http_exception_handler(request: Request, exc: HTTPException):
+    return ORJSONResponse(
+        status_code=exc.status_code,
+        content={"detail": exc.detail},
+        headers=exc.headers,
+    )
+
+
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request: Request, exc: RequestValidationError):
+    return ORJSONResponse(
+        status_code=422, content={"detail": jsonable_encoder(exc.errors())}
+    )
+
+
+@app.exception_handler(Exception)
+async def general_exception_handler(request: Request, exc: Exception):
+    logger.exception("unhandled error on %s: %s", request.url.path, exc)
+    return ORJSONResponse(status_code=500, content={"error": str(exc)})
+
+
+# Resolved once: whether the UI bundle ships is fixed for the life of
+# the process, so the root route skips the per-request stat call.
+_UI_INDEX = Path(__file__).parent / "ui" / "index.html"
+_UI_INDEX_EXISTS = _UI_INDEX.exists()
+
+
+@app.get("/")
+async def serve_ui():
+    if _UI_INDEX_EXISTS:
+        return FileResponse(_UI_INDEX)
+    return {"message": "Phaethon API. UI assets not installed."}
+
+
+# Health checks only need second resolution, so the ISO string is
+# re-formatted at most once per second per worker.
+_iso_cache = (0, "")
+
+
+def _iso_now() -> str:
+    global _iso_cache
+    sec = time.time_ns() // 1_000_000_000
+    if sec != _iso_cache[0]:
+        _iso_cache = (sec, datetime.utcfromtimestamp(sec).isoformat())
+    return _iso_cache[1]
+
+
+@app.get("/api/health")
+async def health():
+    return {"status": "ok", "timestamp": _iso_now()}
+
+
+@app.get("/api/status")
+async def status(user_id: str):
+    profile = profile_manager.get_or_create_user(user_id)
+    return {
+        "user_id": user_id,
+        "total_content_processed": profile.total_content_processed,
+        "total_decisions_made": profile.total_decisions_made,
+        "rules": len(profile.rules),
+        "value_confidence": profile.values.confidence,
+    }
+
+
+@app.post("/api/evaluate")
+async def evaluate_content(req: EvaluateContentRequest):
+    profile = profile_manager.get_or_create_user(req.user_id)
+    content = ContentItem(
+        content_id=UUID_POOL.next_id(),
+        title=req.title,
+        url=req.url,
+        # Interned so downstream domain-table probes hit pointer equality.
+        domain=sys.intern(req.domain),
+        content_type=req.content_type,
+        metadata=ContentMetadata(topics=req.topics),
+    )
+    decision = decision_engine.make_decision(content, profile)
+    event_logger.log_event(
+        EventLog(
+            user_id=req.user_id,
+            level=EventLevel.INFO,
+            event_type="DECISION_MADE",
+            message=f"{decision.action.value} for {req.domain}",
+            metadata={"content_id": content.content_id, "decision_id": decision.decision_id},
+        )
+    )
+    profile_manager.update_statistics(req.user_id, content_processed=1, decisions_made=1)
+    return {
+        "decision_id": decision.decision_id,
+        "content_id": content.content_id,
+        "action": decision.action,
+        "scores": decision.scores,
+        "applied_rules": decision.applied_rules,
+        "reasoning": decision.reasoning,
+    }
+
+
+@app.post("/api/feedback")
+async def submit_feedback(req: FeedbackRequest):
+    profile = profile_manager.get_or_create_user(req.user_id)
+    feedback = UserFeedback(
+        feedback_id=UUID_POOL.next_id(),
+        user_id=req.user_id,
+        content_id=req.content_id,
+        decision_id=req.decision_id,
+        rating=req.rating,
+        comment=req.comment,
+    )
+    updated = values_estimator.update_from_feedback(profile.values, feedback)
+    profile_manager.update_values(req.user_id, updated)
+    event_logger.log_event(
+        EventLog(
+            user_id=req.user_id,
+            level=EventLevel.INFO,
+            event_type="VALUE_UPDATED",
+            message=f"feedback rating={req.rating}",
+            metadata={"feedback_id": feedback.feedback_id},
+        )
+    )
+    return {"feedback_id": feedback.feedback_id, "confidence": updated.confidence}
+
+
+@app.post("/api/rules")
+async def create_rule(req: RuleRequest):
+    rule = InterventionRule(
+        rule_id=UUID_POOL.next_id(),
+        domain=req.domain,
+        content_type=req.content_type,
+        keyword_includes=req.keyword_includes,
+        keyword_excludes=req.keyword_excludes,
+        action=req.action,
+        priority=req.priority,
+        reason=req.reason,
+    )
+    if not decision_engine.rules_engine.validate_rule(rule):
+        raise HTTPException(status_code=422, detail="rule constrains nothing")
+    profile_manager.add_rule(req.user_id, rule)
+    event_logger.log_event(
+        EventLog(
+            user_id=req.user_id,
+            level=EventLevel.INFO,
+            event_type="RULE_CREATED",
+            message=f"rule {rule.rule_id} created",
+            metadata={"rule_id": rule.rule_id},
+        )
+    )
+    return {"rule_id": rule.rule_id}
+
+
+@app.delete("/api/rules/{rule_id}")
+async def delete_rule(rule_id: str, user_id: str):
+    removed = profile_manager.remove_rule(user_id, rule_id)
+    if not removed:
+        raise HTTPException(status_code=404, detail="rule not found")
+    return {"removed": rule_id}
+
+
+@app.get("/api/rules")
+async def list_rules(user_id: str):
+    profile = profile_manager.get_or_create_user(user_id)
+    return {"user_id": user_id, "rules": profile.rules}
+
+
+@app.get("/api/events")
+async def get_events(
+    user_id: Optional[str] = None,
+    level: Optional[str] = None,
+    limit: int = 100,
+):
+    events = event_logger.get_events(user_id=user_id, level=level, limit=limit)
+    return {"events": events, "count": len(events)}
+
+
+@app.get("/api/profile/{user_id}")
+async def get_profile(user_id: str):
+    profile = profile_manager.get_or_create_user(user_id)
+    return profile
@@ -0,0 +1 @@
+"""SQLite-backed persistence."""
@@ -0,0 +1,210 @@
+"""Append-only event log in SQLite.
+
+Writes are queued and flushed in batches by a background thread so the
+hot decision path never waits on a per-event commit.
+"""
+
+import queue
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+
+from .. import config
+from ..core.schemas import EventLog
+from .timeutils import us_to_iso
+
+_SENTINEL = None  # queue item that tells the drain thread to exit
+_BATCH_SIZE = 256
+
+# How long a query result may be served from memory. Dashboard polls
+# repeat the same (user, level, limit) query far faster than this.
+_QUERY_TTL = 10.0
+
+_INSERT_SQL = """
+    INSERT INTO event_logs
+        (event_id, user_id, level, event_type, message, metadata_json, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SELECT_COLUMNS = (
+    "SELECT event_id, user_id, level, event_type, message, metadata_json, timestamp "
+    "FROM event_logs"
+)
+_ORDER_LIMIT = " ORDER BY timestamp DESC LIMIT ?"
+
+# One precompiled query per filter combination, keyed by
+# (user_id given, level given); built once instead of concatenated per call.
+_SELECT_SQL = {
+    (False, False): _SELECT_COLUMNS + _ORDER_LIMIT,
+    (True, False): _SELECT_COLUMNS + " WHERE user_id = ?" + _ORDER_LIMIT,
+    (False, True): _SELECT_COLUMNS + " WHERE level = ?" + _ORDER_LIMIT,
+    (True, True): _SELECT_COLUMNS + " WHERE user_id = ? AND level = ?" + _ORDER_LIMIT,
+}
+
+
+class EventLogger:
+    """Writes and queries :class:`EventLog` rows."""
+
+    def __init__(self, db_path=None):
+        if db_path is None:
+            config.ensure_data_dirs()
+            db_path = config.DB_PATH
+        self.db_path = str(db_path)
+        self._local = threading.local()
+        self._init_db()
+        self._q: "queue.Queue" = queue.Queue()
+        # Short-TTL result cache for get_events, invalidated on writes;
+        # an in-process dict plays the role an external cache would in
+        # a multi-process deployment.
+        self._query_cache: Dict[Tuple, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._query_lock = threading.Lock()
+        self._drain_thread = threading.Thread(
+            target=self._drain, name="phaethon-event-log", daemon=True
+        )
+        self._drain_thread.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _init_db(self) -> None:
+        conn = self._connect()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS event_logs (
+                event_id TEXT PRIMARY KEY,
+                user_id TEXT,
+                level TEXT NOT NULL,
+                event_type TEXT NOT NULL,
+                message TEXT NOT NULL,
+                metadata_json TEXT NOT NULL,
+                timestamp INTEGER NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_events_user_ts "
+            "ON event_logs(user_id, timestamp DESC)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_events_level_ts "
+            "ON event_logs(level, timestamp DESC)"
+        )
+        # Migrate legacy ISO-text timestamps so integer ordering holds.
+        conn.execute(
+            "UPDATE event_logs SET "
+            "timestamp = CAST(strftime('%s', timestamp) AS INTEGER) * 1000000 "
+            "WHERE typeof(timestamp) = 'text'"
+        )
+        conn.commit()
+        conn.close()
+
+    def _reader(self) -> sqlite3.Connection:
+        """Cached per-thread read connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+
+    def log_event(self, event: EventLog) -> None:
+        """Enqueue one event row; the background thread persists it."""
+        with self._query_lock:
+            if self._query_cache:
+                # Drop cached results the new event could appear in.
+                for key in list(self._query_cache):
+                    if key[0] is None or key[0] == event.user_id:
+                        del self._query_cache[key]
+        self._q.put(
+            (
+                event.event_id,
+                event.user_id,
+                event.level.value,
+                event.event_type,
+                event.message,
+                orjson.dumps(event.metadata, default=str).decode(),
+                event.timestamp_us,
+            )
+        )
+
+    def _drain(self) -> None:
+        conn = self._connect()
+        running = True
+        while running:
+            items = [self._q.get()]
+            # Opportunistically batch whatever else is already queued so
+            # one transaction amortizes the commit across many events.
+            while len(items) < _BATCH_SIZE:
+                try:
+                    items.append(self._q.get_nowait())
+                except queue.Empty:
+                    break
+            rows = [item for item in items if item is not _SENTINEL]
+            if len(rows) != len(items):
+                running = False
+            if rows:
+                with conn:
+                    conn.executemany(_INSERT_SQL, rows)
+            for _ in items:
+                self._q.task_done()
+        conn.close()
+
+    def flush(self) -> None:
+        """Block until every queued event has been written."""
+        self._q.join()
+
+    def close(self) -> None:
+        """Flush outstanding events and stop the drain thread."""
+        self._q.put(_SENTINEL)
+        self._drain_thread.join()
+
+    def get_events(
+        self,
+        user_id: Optional[str] = None,
+        level: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Query recent events, newest first, optionally filtered.
+
+        Results are cached for a few seconds (and invalidated by new
+        matching events), so repeated dashboard polls skip the flush
+        and the query entirely.
+        """
+        key = (user_id, level, limit)
+        now = time.monotonic()
+        with self._query_lock:
+            cached = self._query_cache.get(key)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+
+        self.flush()
+        params: List[Any] = []
+        if user_id is not None:
+            params.append(user_id)
+        if level is not None:
+            params.append(level)
+        params.append(limit)
+        query = _SELECT_SQL[(user_id is not None, level is not None)]
+
+        cursor = self._reader().execute(query, params)
+        rows = cursor.fetchall()
+        events = [
+            {
+                "event_id": row[0],
+                "user_id": row[1],
+                "level": row[2],
+                "event_type": row[3],
+                "message": row[4],
+                "metadata": orjson.loads(row[5]),
+                "timestamp": us_to_iso(row[6]),
+            }
+            for row in rows
+        ]
+        with self._query_lock:
+            self._query_cache[key] = (now + _QUERY_TTL, events)
+        return events
@@ -0,0 +1,30 @@
+"""Integer-microsecond timestamp helpers for the storage layer.
+
+Hot write paths store epoch microseconds (cheap ints, index-friendly)
+and only materialize ``datetime`` objects when a caller reads them.
+All datetimes are naive UTC, matching ``datetime.utcnow()`` use
+elsewhere in the codebase.
+"""
+
+import time
+from datetime import datetime, timezone
+
+
+def us_now() -> int:
+    """Current time as integer microseconds since the epoch."""
+    return time.time_ns() // 1000
+
+
+def dt_to_us(dt: datetime) -> int:
+    """Convert a naive-UTC datetime to epoch microseconds."""
+    return int(dt.replace(tzinfo=timezone.utc).timestamp() * 1_000_000)
+
+
+def us_to_dt(us: int) -> datetime:
+    """Convert epoch microseconds back to a naive-UTC datetime."""
+    return datetime.utcfromtimestamp(us / 1_000_000)
+
+
+def us_to_iso(us: int) -> str:
+    """ISO-8601 string for an epoch-microseconds timestamp."""
+    return us_to_dt(us).isoformat()
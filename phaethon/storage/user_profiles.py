@@ -0,0 +1,473 @@
+"""SQLite-backed persistence for user profiles."""
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+import orjson
+from pydantic import TypeAdapter
+
+from .. import config
+from .timeutils import dt_to_us, us_now, us_to_dt
+from ..core.schemas import (
+    ACTION_LOOKUP,
+    CONTENT_TYPE_LOOKUP,
+    InterventionRule,
+    SystemSettings,
+    UserPreferences,
+    UserProfile,
+    ValueProfile,
+)
+
+
+# Validates a whole legacy rules_json blob in one pydantic-core pass
+# instead of per-item model_validate calls.
+_RULES_ADAPTER = TypeAdapter(List[InterventionRule])
+
+# SQLite's default bound-parameter limit; IN (...) queries are chunked.
+_MAX_SQL_PARAMS = 999
+
+# How long statistics increments may sit in memory before being flushed.
+_STATS_FLUSH_INTERVAL = 2.0
+
+_SQL_UPSERT_USER = """
+    INSERT OR REPLACE INTO user_profiles
+        (user_id, values_json, preferences_json,
+         settings_json, total_content_processed, total_decisions_made,
+         created_at_us, updated_at_us)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+class UserProfileManager:
+    """Stores and retrieves :class:`UserProfile` rows in SQLite."""
+
+    def __init__(self, db_path=None):
+        if db_path is None:
+            config.ensure_data_dirs()
+            db_path = config.DB_PATH
+        self.db_path = str(db_path)
+        self._local = threading.local()
+        # Parsed-profile LRU: repeated get_user calls on the decision
+        # path return the cached object without SQL or pydantic work.
+        self._cache: "OrderedDict[str, UserProfile]" = OrderedDict()
+        self._cache_cap = 1024
+        self._cache_lock = threading.RLock()
+        # Statistics increments are coalesced here and flushed in one
+        # batched UPDATE, instead of a disk write per evaluation.
+        self._pending_stats: Dict[str, List[int]] = {}
+        self._stats_lock = threading.Lock()
+        self._init_db()
+        self._stats_thread = threading.Thread(
+            target=self._stats_flush_loop, name="phaethon-stats-flush", daemon=True
+        )
+        self._stats_thread.start()
+
+    def _conn(self) -> sqlite3.Connection:
+        """One cached connection per thread, in WAL mode.
+
+        Reconnecting per call re-parses the DB header and throws away
+        SQLite's page cache; a long-lived connection keeps both warm.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # A generous statement cache means repeated statements like
+            # the save_user upsert are parsed and planned only once.
+            conn = sqlite3.connect(
+                self.db_path, check_same_thread=False, cached_statements=256
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-20000")
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self) -> None:
+        conn = self._conn()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS user_profiles (
+                user_id TEXT PRIMARY KEY,
+                values_json TEXT NOT NULL,
+                preferences_json TEXT NOT NULL,
+                settings_json TEXT NOT NULL,
+                total_content_processed INTEGER NOT NULL DEFAULT 0,
+                total_decisions_made INTEGER NOT NULL DEFAULT 0,
+                created_at_us INTEGER NOT NULL,
+                updated_at_us INTEGER NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS intervention_rules (
+                user_id TEXT NOT NULL,
+                rule_id TEXT NOT NULL,
+                domain TEXT,
+                content_type TEXT,
+                keyword_includes_json TEXT NOT NULL DEFAULT '[]',
+                keyword_excludes_json TEXT NOT NULL DEFAULT '[]',
+                action TEXT NOT NULL,
+                priority INTEGER NOT NULL DEFAULT 0,
+                reason TEXT,
+                is_active INTEGER NOT NULL DEFAULT 1,
+                created_at TEXT NOT NULL,
+                PRIMARY KEY (user_id, rule_id)
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_rules_user_active_priority "
+            "ON intervention_rules(user_id, is_active, priority DESC)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_rules_user_domain "
+            "ON intervention_rules(user_id, domain)"
+        )
+        self._migrate_rules_json(conn)
+        self._migrate_text_timestamps(conn)
+        conn.commit()
+
+    @staticmethod
+    def _migrate_text_timestamps(conn: sqlite3.Connection) -> None:
+        """One-time migration of legacy ISO-text timestamp columns."""
+        columns = [r[1] for r in conn.execute("PRAGMA table_info(user_profiles)")]
+        if "created_at" not in columns:
+            return
+        conn.execute("ALTER TABLE user_profiles ADD COLUMN created_at_us INTEGER")
+        conn.execute("ALTER TABLE user_profiles ADD COLUMN updated_at_us INTEGER")
+        conn.execute(
+            "UPDATE user_profiles SET "
+            "created_at_us = CAST(strftime('%s', created_at) AS INTEGER) * 1000000, "
+            "updated_at_us = CAST(strftime('%s', updated_at) AS INTEGER) * 1000000"
+        )
+        conn.execute("ALTER TABLE user_profiles DROP COLUMN created_at")
+        conn.execute("ALTER TABLE user_profiles DROP COLUMN updated_at")
+
+    def _migrate_rules_json(self, conn: sqlite3.Connection) -> None:
+        """One-time migration of the legacy rules_json blob column."""
+        columns = [r[1] for r in conn.execute("PRAGMA table_info(user_profiles)")]
+        if "rules_json" not in columns:
+            return
+        for user_id, rules_json in conn.execute(
+            "SELECT user_id, rules_json FROM user_profiles"
+        ).fetchall():
+            for rule in _RULES_ADAPTER.validate_json(rules_json):
+                self._insert_rule(conn, user_id, rule)
+        conn.execute("ALTER TABLE user_profiles DROP COLUMN rules_json")
+
+    @staticmethod
+    def _insert_rule(
+        conn: sqlite3.Connection, user_id: str, rule: InterventionRule
+    ) -> None:
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO intervention_rules
+                (user_id, rule_id, domain, content_type, keyword_includes_json,
+                 keyword_excludes_json, action, priority, reason, is_active,
+                 created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                user_id,
+                rule.rule_id,
+                rule.domain,
+                rule.content_type.value if rule.content_type is not None else None,
+                orjson.dumps(rule.keyword_includes).decode(),
+                orjson.dumps(rule.keyword_excludes).decode(),
+                rule.action.value,
+                rule.priority,
+                rule.reason,
+                int(rule.is_active),
+                rule.created_at.isoformat(),
+            ),
+        )
+
+    @staticmethod
+    def _rule_from_row(row) -> InterventionRule:
+        # Every field is coerced right here (enum lookups, json decode,
+        # fromisoformat), so model_construct skips a redundant
+        # validation pass per stored rule.
+        return InterventionRule.model_construct(
+            rule_id=row[0],
+            domain=row[1],
+            content_type=CONTENT_TYPE_LOOKUP[row[2]] if row[2] is not None else None,
+            keyword_includes=orjson.loads(row[3]),
+            keyword_excludes=orjson.loads(row[4]),
+            action=ACTION_LOOKUP[row[5]],
+            priority=row[6],
+            reason=row[7],
+            is_active=bool(row[8]),
+            created_at=datetime.fromisoformat(row[9]),
+        )
+
+    def _load_rules(self, user_id: str) -> list:
+        rows = self._conn().execute(
+            """
+            SELECT rule_id, domain, content_type, keyword_includes_json,
+                   keyword_excludes_json, action, priority, reason, is_active,
+                   created_at
+            FROM intervention_rules WHERE user_id = ?
+            ORDER BY priority DESC
+            """,
+            (user_id,),
+        ).fetchall()
+        return [self._rule_from_row(row) for row in rows]
+
+    def save_user(self, profile: UserProfile) -> None:
+        """Insert or replace the full profile row."""
+        profile.updated_at = datetime.utcnow()
+        profile._compiled_rules = None  # rules may have changed; recompile lazily
+        profile._value_weights = None
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                _SQL_UPSERT_USER,
+                (
+                    profile.user_id,
+                    profile.values.model_dump_json(),
+                    profile.preferences.model_dump_json(),
+                    profile.settings.model_dump_json(),
+                    profile.total_content_processed,
+                    profile.total_decisions_made,
+                    dt_to_us(profile.created_at),
+                    dt_to_us(profile.updated_at),
+                ),
+            )
+            conn.execute(
+                "DELETE FROM intervention_rules WHERE user_id = ?",
+                (profile.user_id,),
+            )
+            for rule in profile.rules:
+                self._insert_rule(conn, profile.user_id, rule)
+        # The upsert wrote absolute totals (pending deltas included if
+        # the profile came from the cache); drop them to avoid a
+        # double-count at the next flush.
+        with self._stats_lock:
+            self._pending_stats.pop(profile.user_id, None)
+        self._cache_put(profile)
+
+    def _cache_put(self, profile: UserProfile) -> None:
+        with self._cache_lock:
+            self._cache[profile.user_id] = profile
+            self._cache.move_to_end(profile.user_id)
+            while len(self._cache) > self._cache_cap:
+                self._cache.popitem(last=False)
+
+    def _cache_invalidate(self, user_id: str) -> None:
+        with self._cache_lock:
+            self._cache.pop(user_id, None)
+
+    def get_user(self, user_id: str) -> Optional[UserProfile]:
+        """Load one profile, or ``None`` if the user is unknown."""
+        with self._cache_lock:
+            cached = self._cache.get(user_id)
+            if cached is not None:
+                self._cache.move_to_end(user_id)
+                return cached
+        cursor = self._conn().execute(
+            "SELECT * FROM user_profiles WHERE user_id = ?", (user_id,)
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        profile = self._profile_from_row(row, self._load_rules(user_id))
+        self._apply_pending_stats(profile)
+        self._cache_put(profile)
+        return profile
+
+    def _profile_from_row(self, row, rules: List[InterventionRule]) -> UserProfile:
+        return UserProfile(
+            user_id=row[0],
+            values=ValueProfile.model_validate(orjson.loads(row[1])),
+            rules=rules,
+            preferences=UserPreferences.model_validate(orjson.loads(row[2])),
+            settings=SystemSettings.model_validate(orjson.loads(row[3])),
+            total_content_processed=row[4],
+            total_decisions_made=row[5],
+            created_at=us_to_dt(row[6]),
+            updated_at=us_to_dt(row[7]),
+        )
+
+    def get_users_bulk(self, user_ids: Iterable[str]) -> Dict[str, UserProfile]:
+        """Load many profiles at once; unknown ids are simply omitted.
+
+        Cache hits are served directly; the rest are fetched with one
+        ``IN (...)`` query per chunk (profiles plus their rules) instead
+        of a round-trip per user. Fetched profiles enter the cache.
+        """
+        result: Dict[str, UserProfile] = {}
+        missing: List[str] = []
+        with self._cache_lock:
+            for user_id in dict.fromkeys(user_ids):
+                cached = self._cache.get(user_id)
+                if cached is not None:
+                    self._cache.move_to_end(user_id)
+                    result[user_id] = cached
+                else:
+                    missing.append(user_id)
+        if not missing:
+            return result
+
+        conn = self._conn()
+        for start in range(0, len(missing), _MAX_SQL_PARAMS):
+            chunk = missing[start : start + _MAX_SQL_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            rules_by_user: Dict[str, List[InterventionRule]] = {
+                user_id: [] for user_id in chunk
+            }
+            for row in conn.execute(
+                "SELECT user_id, rule_id, domain, content_type,"
+                " keyword_includes_json, keyword_excludes_json, action,"
+                " priority, reason, is_active, created_at"
+                f" FROM intervention_rules WHERE user_id IN ({placeholders})"
+                " ORDER BY priority DESC",
+                chunk,
+            ):
+                rules_by_user[row[0]].append(self._rule_from_row(row[1:]))
+            for row in conn.execute(
+                f"SELECT * FROM user_profiles WHERE user_id IN ({placeholders})",
+                chunk,
+            ):
+                profile = self._profile_from_row(row, rules_by_user[row[0]])
+                self._apply_pending_stats(profile)
+                self._cache_put(profile)
+                result[profile.user_id] = profile
+        return result
+
+    def get_or_create_user(self, user_id: str) -> UserProfile:
+        """Fetch a profile, creating a default one on first sight."""
+        profile = self.get_user(user_id)
+        if profile is not None:
+            return profile
+        values = {
+            category: {dim: config.DEFAULT_VALUE_WEIGHT for dim in dims}
+            for category, dims in config.DEFAULT_VALUE_HIERARCHY.items()
+        }
+        profile = UserProfile(user_id=user_id, values=ValueProfile(values=values))
+        self.save_user(profile)
+        return profile
+
+    def add_rule(self, user_id: str, rule: InterventionRule) -> None:
+        profile = self.get_or_create_user(user_id)
+        conn = self._conn()
+        with conn:
+            self._insert_rule(conn, user_id, rule)
+            conn.execute(
+                "UPDATE user_profiles SET updated_at_us = ? WHERE user_id = ?",
+                (us_now(), user_id),
+            )
+        # Write-through: patch the cached profile in place so the next
+        # evaluation reuses it instead of reloading and revalidating.
+        with self._cache_lock:
+            profile.rules.append(rule)
+            profile._compiled_rules = None
+            profile.updated_at = datetime.utcnow()
+
+    def remove_rule(self, user_id: str, rule_id: str) -> bool:
+        """Remove a rule by id; returns whether anything was removed."""
+        conn = self._conn()
+        with conn:
+            cursor = conn.execute(
+                "DELETE FROM intervention_rules WHERE user_id = ? AND rule_id = ?",
+                (user_id, rule_id),
+            )
+            removed = cursor.rowcount > 0
+            if removed:
+                conn.execute(
+                    "UPDATE user_profiles SET updated_at_us = ? WHERE user_id = ?",
+                    (us_now(), user_id),
+                )
+        if removed:
+            with self._cache_lock:
+                cached = self._cache.get(user_id)
+                if cached is not None:
+                    cached.rules = [r for r in cached.rules if r.rule_id != rule_id]
+                    cached._compiled_rules = None
+                    cached.updated_at = datetime.utcnow()
+        return removed
+
+    def update_values(self, user_id: str, values: ValueProfile) -> None:
+        profile = self.get_or_create_user(user_id)
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "UPDATE user_profiles SET values_json = ?, updated_at_us = ? WHERE user_id = ?",
+                (values.model_dump_json(), us_now(), user_id),
+            )
+        with self._cache_lock:
+            profile.values = values
+            profile._value_weights = None  # derived from values; rebuild lazily
+            profile.updated_at = datetime.utcnow()
+
+    def update_preferences(self, user_id: str, preferences: UserPreferences) -> None:
+        profile = self.get_or_create_user(user_id)
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "UPDATE user_profiles SET preferences_json = ?, updated_at_us = ? WHERE user_id = ?",
+                (preferences.model_dump_json(), us_now(), user_id),
+            )
+        with self._cache_lock:
+            profile.preferences = preferences
+            profile.updated_at = datetime.utcnow()
+
+    def update_statistics(
+        self, user_id: str, content_processed: int = 0, decisions_made: int = 0
+    ) -> None:
+        """Record counter increments; the DB write is deferred.
+
+        Deltas accumulate in memory and are flushed by a background
+        thread (or :meth:`flush_statistics`), so the evaluation path
+        never waits on a disk write. The cached profile is bumped
+        immediately so reads stay consistent.
+        """
+        self.get_or_create_user(user_id)
+        with self._stats_lock:
+            pending = self._pending_stats.get(user_id)
+            if pending is None:
+                pending = self._pending_stats[user_id] = [0, 0]
+            pending[0] += content_processed
+            pending[1] += decisions_made
+        with self._cache_lock:
+            cached = self._cache.get(user_id)
+            if cached is not None:
+                cached.total_content_processed += content_processed
+                cached.total_decisions_made += decisions_made
+
+    def _apply_pending_stats(self, profile: UserProfile) -> None:
+        """Fold unflushed deltas into a profile freshly read from disk."""
+        with self._stats_lock:
+            pending = self._pending_stats.get(profile.user_id)
+            if pending is not None:
+                profile.total_content_processed += pending[0]
+                profile.total_decisions_made += pending[1]
+
+    def flush_statistics(self) -> None:
+        """Write all pending counter deltas in one batched UPDATE."""
+        with self._stats_lock:
+            if not self._pending_stats:
+                return
+            pending, self._pending_stats = self._pending_stats, {}
+        now = us_now()
+        conn = self._conn()
+        with conn:
+            conn.executemany(
+                """
+                UPDATE user_profiles
+                SET total_content_processed = total_content_processed + ?,
+                    total_decisions_made = total_decisions_made + ?,
+                    updated_at_us = ?
+                WHERE user_id = ?
+                """,
+                [(cp, dm, now, uid) for uid, (cp, dm) in pending.items()],
+            )
+
+    def _stats_flush_loop(self) -> None:
+        while True:
+            time.sleep(_STATS_FLUSH_INTERVAL)
+            self.flush_statistics()
@@ -0,0 +1 @@
+"""Small shared utilities with no Phaethon-specific dependencies."""
@@ -0,0 +1,218 @@
+"""Values estimation, behavioral analysis, and feedback processing."""
+
+from datetime import datetime, timedelta
+
+from phaethon.core.schemas import UserFeedback, ValueProfile
+from phaethon.learning.behavioral_patterns import (
+    BehavioralAnalyzer,
+    EngagementHistoryArrays,
+)
+from phaethon.learning.feedback_processor import FeedbackProcessor
+from phaethon.learning.values_estimator import BayesianValuesEstimator
+
+
+def make_profile():
+    return ValueProfile(
+        values={
+            "productivity": {"learning": 0.5, "focus": 0.5},
+            "wellbeing": {"sleep_quality": 0.5},
+        },
+        confidence=0.3,
+    )
+
+
+class TestBayesianValuesEstimator:
+    def setup_method(self):
+        self.estimator = BayesianValuesEstimator()
+
+    def test_update_from_feedback(self):
+        profile = make_profile()
+        feedback = UserFeedback(user_id="u1", rating=1)
+        updated = self.estimator.update_from_feedback(profile, feedback)
+        assert updated.values["productivity"]["learning"] < 0.5
+        assert all(
+            0.0 <= v <= 1.0
+            for dims in updated.values.values()
+            for v in dims.values()
+        )
+
+    def test_negative_feedback_raises_weights(self):
+        profile = make_profile()
+        feedback = UserFeedback(user_id="u1", rating=-1)
+        updated = self.estimator.update_from_feedback(profile, feedback)
+        assert updated.values["productivity"]["focus"] > 0.5
+
+    def test_confidence_increases_with_feedback(self):
+        profile = make_profile()
+        for _ in range(5):
+            profile = self.estimator.update_from_feedback(
+                profile, UserFeedback(user_id="u1", rating=1)
+            )
+        assert profile.confidence > 0.3
+        assert profile.confidence <= self.estimator.MAX_CONFIDENCE
+
+    def test_update_from_feedback_batch(self):
+        profile = make_profile()
+        batch = [
+            UserFeedback(user_id="u1", rating=1),
+            UserFeedback(user_id="u1", rating=1),
+            UserFeedback(user_id="u1", rating=-1),
+        ]
+        updated = self.estimator.update_from_feedback_batch(profile, batch)
+        expected = 0.5 * 0.95 * 0.95 * 1.05
+        assert abs(updated.values["productivity"]["learning"] - expected) < 1e-9
+        assert abs(updated.confidence - 0.33) < 1e-9
+
+    def test_missing_rating_is_noop(self):
+        profile = make_profile()
+        updated = self.estimator.update_from_feedback(
+            profile, UserFeedback(user_id="u1")
+        )
+        assert updated is profile
+
+
+class TestBehavioralAnalyzer:
+    def setup_method(self):
+        self.analyzer = BehavioralAnalyzer()
+
+    def test_analyze_time_of_day_patterns(self):
+        base = datetime(2024, 1, 1, 9, 0)
+        history = [
+            {"timestamp": base, "engagement_score": 0.8},
+            {"timestamp": base + timedelta(minutes=10), "engagement_score": 0.6},
+            {"timestamp": base.replace(hour=22), "engagement_score": 0.2},
+        ]
+        patterns = self.analyzer.analyze_time_of_day_patterns(history)
+        assert patterns[9] == 0.7
+        assert patterns[22] == 0.2
+
+    def test_analyze_content_type_preferences(self):
+        history = [
+            {"content_type": "article", "engagement_score": 0.9},
+            {"content_type": "article", "engagement_score": 0.7},
+            {"content_type": "social_post", "engagement_score": 0.2},
+        ]
+        prefs = self.analyzer.analyze_content_type_preferences(history)
+        assert prefs["article"] == 0.8
+        assert prefs["social_post"] == 0.2
+
+    def test_analyze_all_patterns_matches_individual(self):
+        base = datetime(2024, 1, 1, 9, 0)
+        history = [
+            {
+                "timestamp": base,
+                "content_type": "article",
+                "domain": "arxiv.org",
+                "engagement_score": 0.8,
+            },
+            {
+                "timestamp": base.replace(hour=22),
+                "content_type": "social_post",
+                "domain": "twitter.com",
+                "engagement_score": 0.2,
+            },
+        ]
+        by_hour, by_type, by_domain = self.analyzer.analyze_all_patterns(history)
+        assert by_hour == self.analyzer.analyze_time_of_day_patterns(history)
+        assert by_type == self.analyzer.analyze_content_type_preferences(history)
+        assert by_domain == self.analyzer.analyze_domain_preferences(history)
+
+    def test_arrays_view_matches_dict_path(self):
+        base = datetime(2024, 1, 1, 9, 0)
+        history = [
+            {
+                "timestamp": base,
+                "content_type": "article",
+                "domain": "arxiv.org",
+                "engagement_score": 0.8,
+                "time_spent": 120,
+            },
+            {
+                "timestamp": base.replace(hour=22),
+                "content_type": "social_post",
+                "domain": "twitter.com",
+                "engagement_score": 0.2,
+                "time_spent": 10,
+            },
+        ]
+        arrays = EngagementHistoryArrays.from_events(history)
+        assert self.analyzer.analyze_time_of_day_patterns(
+            arrays
+        ) == self.analyzer.analyze_time_of_day_patterns(history)
+        assert self.analyzer.analyze_content_type_preferences(
+            arrays
+        ) == self.analyzer.analyze_content_type_preferences(history)
+        assert self.analyzer.analyze_domain_preferences(
+            arrays
+        ) == self.analyzer.analyze_domain_preferences(history)
+
+    def test_identify_distraction_triggers(self):
+        history = [
+            {"domain": "twitter.com", "topics": ["memes"]},
+            {"domain": "twitter.com", "topics": ["memes"]},
+            {"domain": "arxiv.org", "topics": ["Machine Learning"]},
+        ]
+        triggers = self.analyzer.identify_distraction_triggers(
+            history, goal_topics=["machine learning"]
+        )
+        assert triggers == {"twitter.com": 2}
+
+    def test_detect_attention_fragmentation(self):
+        now = datetime.utcnow()
+        history = [
+            {"timestamp": now, "time_spent": 10},
+            {"timestamp": now, "time_spent": 5},
+            {"timestamp": now, "time_spent": 300},
+        ]
+        result = self.analyzer.detect_attention_fragmentation(history)
+        assert result["items_in_window"] == 3
+        assert 0.0 <= result["fragmentation_score"] <= 1.0
+
+
+class TestFeedbackProcessor:
+    def setup_method(self):
+        self.processor = FeedbackProcessor()
+
+    def test_process_implicit_feedback(self):
+        result = self.processor.process_implicit_feedback(
+            "u1", "c1", action="spent_time", time_spent=300
+        )
+        assert result["signal"] == "implicit_agree"
+        assert result["confidence"] > 0.7
+
+    def test_dismissal_is_disagreement(self):
+        result = self.processor.process_implicit_feedback("u1", "c1", action="dismissed")
+        assert result["signal"] == "implicit_disagree"
+
+    def test_aggregate_feedback_signals(self):
+        feedbacks = [
+            UserFeedback(user_id="u1", rating=1),
+            UserFeedback(user_id="u1", rating=1),
+            UserFeedback(user_id="u1", rating=0),
+        ]
+        result = self.processor.aggregate_feedback_signal(feedbacks)
+        assert result["direction"] == 1.0
+        assert result["confidence"] > 0.5
+
+    def test_aggregate_many_matches_single(self):
+        batches = {
+            "u1": [
+                UserFeedback(user_id="u1", rating=1),
+                UserFeedback(user_id="u1", rating=-1),
+            ],
+            "u2": [UserFeedback(user_id="u2", rating=-1)],
+            "u3": [UserFeedback(user_id="u3", rating=None)],
+        }
+        results = self.processor.aggregate_many(batches)
+        for user_id, feedbacks in batches.items():
+            expected = self.processor.aggregate_feedback_signal(feedbacks)
+            assert results[user_id]["direction"] == expected["direction"]
+            assert abs(results[user_id]["confidence"] - expected["confidence"]) < 1e-9
+
+    def test_detect_user_goal_drift(self):
+        old = make_profile()
+        new = make_profile()
+        new.values["productivity"]["learning"] = 0.9
+        result = FeedbackProcessor().detect_user_goal_drift([old, new])
+        assert result["drift_detected"]
+        assert abs(result["max_change"] - 0.4) < 1e-9
@@ -0,0 +1,118 @@
+"""RulesEngine matching and evaluation."""
+
+from phaethon.core.rules_engine import RulesEngine
+from phaethon.core.schemas import (
+    ContentItem,
+    ContentType,
+    InterventionAction,
+    InterventionRule,
+)
+
+
+def make_content(title="Improve your focus", domain="example.com", **kwargs):
+    return ContentItem(title=title, domain=domain, **kwargs)
+
+
+def test_rule_matches_keywords():
+    engine = RulesEngine()
+    rule = InterventionRule(keyword_includes=["productivity", "focus"])
+    assert engine._rule_matches(rule, make_content(title="Deep focus at work"))
+    assert not engine._rule_matches(rule, make_content(title="Celebrity gossip"))
+
+
+def test_rule_matches_domain():
+    engine = RulesEngine()
+    rule = InterventionRule(domain="twitter.com")
+    assert engine._rule_matches(rule, make_content(domain="twitter.com"))
+    assert not engine._rule_matches(rule, make_content(domain="arxiv.org"))
+
+
+def test_rule_keyword_excludes():
+    engine = RulesEngine()
+    rule = InterventionRule(
+        keyword_includes=["focus"], keyword_excludes=["advertisement"]
+    )
+    assert not engine._rule_matches(
+        rule, make_content(title="Focus advertisement special")
+    )
+
+
+def test_rule_content_type():
+    engine = RulesEngine()
+    rule = InterventionRule(content_type=ContentType.VIDEO)
+    assert engine._rule_matches(
+        rule, make_content(content_type=ContentType.VIDEO)
+    )
+    assert not engine._rule_matches(
+        rule, make_content(content_type=ContentType.ARTICLE)
+    )
+
+
+def test_evaluate_rules_returns_highest_priority():
+    engine = RulesEngine()
+    low = InterventionRule(
+        domain="twitter.com", action=InterventionAction.WARN, priority=1
+    )
+    high = InterventionRule(
+        domain="twitter.com", action=InterventionAction.BLOCK, priority=10
+    )
+    action, rule = engine.evaluate_rules(
+        make_content(domain="twitter.com"), [low, high]
+    )
+    assert action == InterventionAction.BLOCK
+    assert rule is high
+
+
+def test_evaluate_rules_skips_inactive():
+    engine = RulesEngine()
+    inactive = InterventionRule(
+        domain="twitter.com", action=InterventionAction.BLOCK, is_active=False
+    )
+    action, rule = engine.evaluate_rules(make_content(domain="twitter.com"), [inactive])
+    assert action is None
+    assert rule is None
+
+
+def test_evaluate_rules_with_index():
+    engine = RulesEngine()
+    keyword = InterventionRule(
+        keyword_includes=["focus"], action=InterventionAction.ALLOW_PRIORITIZE
+    )
+    domain_only = InterventionRule(
+        domain="twitter.com", action=InterventionAction.BLOCK, priority=5
+    )
+    rules = [keyword, domain_only]
+    engine.index_rules(rules)
+    action, rule = engine.evaluate_rules(
+        make_content(title="Deep focus at work"), rules
+    )
+    assert rule is keyword
+    action, rule = engine.evaluate_rules(
+        make_content(title="Trending now", domain="twitter.com"), rules
+    )
+    assert rule is domain_only
+
+
+def test_evaluate_rules_batch_matches_serial():
+    rules = [
+        InterventionRule(domain="twitter.com", action=InterventionAction.BLOCK),
+        InterventionRule(domain="twitter.com", action=InterventionAction.ALLOW),
+        InterventionRule(keyword_includes=["ai"], action=InterventionAction.WARN),
+        InterventionRule(
+            keyword_includes=["how to"], action=InterventionAction.DELAY, priority=2
+        ),
+    ]
+    contents = [
+        make_content(domain="twitter.com"),  # priority tie: first rule wins
+        make_content(title="Fairy tales tonight"),  # "ai" matches as substring
+        make_content(title="How to use AI", domain="twitter.com"),
+        make_content(title="Nothing relevant", domain="example.org"),
+    ]
+    expected = [RulesEngine().evaluate_rules(c, rules) for c in contents]
+    assert RulesEngine().evaluate_rules_batch(contents, rules) == expected
+
+
+def test_validate_rule_requires_constraint():
+    engine = RulesEngine()
+    assert not engine.validate_rule(InterventionRule())
+    assert engine.validate_rule(InterventionRule(domain="x.com"))
@@ -0,0 +1,58 @@
+"""Schema construction and validation."""
+
+import pytest
+from pydantic import ValidationError
+
+from phaethon.core.schemas import (
+    ContentItem,
+    ContentType,
+    InterventionAction,
+    InterventionRule,
+    ScoringResult,
+    UserFeedback,
+    UserProfile,
+    ValueProfile,
+)
+
+
+def test_content_item_defaults():
+    item = ContentItem(title="Hello", domain="example.com")
+    assert item.content_id
+    assert item.content_type == ContentType.OTHER
+    assert item.extracted_features is None
+    assert item.metadata.topics == []
+
+
+def test_scoring_result_bounds():
+    with pytest.raises(ValidationError):
+        ScoringResult(
+            content_id="c1",
+            alignment_score=1.5,
+            productivity_impact=0.0,
+            wellbeing_impact=0.0,
+        )
+
+
+def test_feedback_rating_bounds():
+    with pytest.raises(ValidationError):
+        UserFeedback(user_id="u1", rating=2)
+    assert UserFeedback(user_id="u1", rating=-1).rating == -1
+
+
+def test_intervention_rule_defaults():
+    rule = InterventionRule(domain="twitter.com")
+    assert rule.is_active
+    assert rule.action == InterventionAction.WARN
+    assert rule.priority == 0
+
+
+def test_value_profile_nested_values():
+    profile = ValueProfile(values={"productivity": {"focus": 0.7}})
+    assert profile.values["productivity"]["focus"] == 0.7
+    assert 0.0 <= profile.confidence <= 1.0
+
+
+def test_user_profile_defaults():
+    profile = UserProfile(user_id="u1")
+    assert profile.rules == []
+    assert profile.total_content_processed == 0
@@ -0,0 +1,106 @@
+"""Feature extraction and content scoring."""
+
+import pytest
+
+from phaethon.core.schemas import ContentItem, InterventionAction, UserProfile, ValueProfile
+from phaethon.scoring.content_features import ContentFeatureExtractor
+from phaethon.scoring.scorer import ContentScorer
+
+
+@pytest.fixture
+def profile():
+    return UserProfile(
+        user_id="u1",
+        values=ValueProfile(
+            values={
+                "productivity": {"learning": 0.8, "focus": 0.7, "output_quality": 0.6},
+                "wellbeing": {"sleep_quality": 0.5},
+            }
+        ),
+    )
+
+
+class TestContentFeatureExtractor:
+    def setup_method(self):
+        self.extractor = ContentFeatureExtractor()
+
+    def test_extracts_topics(self):
+        content = ContentItem(
+            title="New research on AI algorithms", domain="arxiv.org"
+        )
+        features = self.extractor.extract_features(content)
+        assert "technology" in features.main_topics
+        assert "science" in features.main_topics
+
+    def test_detects_clickbait(self):
+        content = ContentItem(
+            title="You won't believe this one weird trick", domain="buzzfeed.com"
+        )
+        assert self.extractor.extract_features(content).is_clickbait
+
+    def test_detects_promotional(self):
+        content = ContentItem(
+            title="Limited time sale: 50% off", domain="shop.example.com"
+        )
+        assert self.extractor.extract_features(content).is_promotional
+
+    def test_neutral_title(self):
+        content = ContentItem(title="Weekly meeting notes", domain="example.com")
+        features = self.extractor.extract_features(content)
+        assert features.tone == "neutral"
+        assert features.emotional_valence == 0.0
+        assert not features.is_clickbait
+
+
+class TestContentScorer:
+    def setup_method(self):
+        self.scorer = ContentScorer()
+
+    def test_learning_domain_scores_higher(self, profile):
+        learning = ContentItem(
+            title="Introduction to queueing theory", domain="arxiv.org"
+        )
+        distraction = ContentItem(
+            title="Hot takes thread", domain="twitter.com"
+        )
+        s_learning = self.scorer.score_content(learning, profile)
+        s_distraction = self.scorer.score_content(distraction, profile)
+        assert s_learning.alignment_score > s_distraction.alignment_score
+
+    def test_score_in_bounds(self, profile):
+        content = ContentItem(title="Anything at all", domain="example.com")
+        result = self.scorer.score_content(content, profile)
+        assert 0.0 <= result.alignment_score <= 1.0
+        assert -1.0 <= result.productivity_impact <= 1.0
+        assert -1.0 <= result.wellbeing_impact <= 1.0
+
+    def test_domain_reputation(self):
+        assert self.scorer._get_domain_reputation("arxiv.org") > 0.9
+        assert self.scorer._get_domain_reputation("twitter.com") < 0.5
+        assert self.scorer._get_domain_reputation("unknown.example") == 0.5
+
+    def test_score_batch_matches_single(self, profile):
+        contents = [
+            ContentItem(title="Introduction to queueing theory", domain="arxiv.org"),
+            ContentItem(title="Hot takes thread", domain="twitter.com"),
+            ContentItem(title="Shocking celebrity scandal!", domain="example.com"),
+            ContentItem(title="Weekly meeting notes", domain="example.com"),
+        ]
+        singles = [self.scorer.score_content(c, profile) for c in contents]
+        for single, batched in zip(singles, self.scorer.score_batch(contents, profile)):
+            assert batched.alignment_score == pytest.approx(single.alignment_score)
+            assert batched.value_alignments == pytest.approx(single.value_alignments)
+            assert batched.productivity_impact == pytest.approx(
+                single.productivity_impact
+            )
+            assert batched.wellbeing_impact == pytest.approx(single.wellbeing_impact)
+            assert batched.recommended_action == single.recommended_action
+            assert batched.confidence == single.confidence
+            assert batched.reasoning == single.reasoning
+
+    def test_recommend_action_extremes(self):
+        assert (
+            self.scorer._recommend_action(0.9, 0.2)
+            == InterventionAction.ALLOW_PRIORITIZE
+        )
+        assert self.scorer._recommend_action(0.1, -0.5) == InterventionAction.BLOCK
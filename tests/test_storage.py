@@ -0,0 +1,74 @@
+"""SQLite persistence round-trips."""
+
+import pytest
+
+from phaethon.core.schemas import EventLevel, EventLog, InterventionRule, UserProfile
+from phaethon.storage.event_logger import EventLogger
+from phaethon.storage.user_profiles import UserProfileManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return UserProfileManager(db_path=tmp_path / "test.db")
+
+
+@pytest.fixture
+def logger(tmp_path):
+    return EventLogger(db_path=tmp_path / "test.db")
+
+
+def test_save_and_get_user(manager):
+    profile = UserProfile(user_id="u1")
+    manager.save_user(profile)
+    loaded = manager.get_user("u1")
+    assert loaded is not None
+    assert loaded.user_id == "u1"
+
+
+def test_get_unknown_user(manager):
+    assert manager.get_user("nobody") is None
+
+
+def test_get_or_create_seeds_defaults(manager):
+    profile = manager.get_or_create_user("fresh")
+    assert "productivity" in profile.values.values
+
+
+def test_add_and_remove_rule(manager):
+    rule = InterventionRule(domain="twitter.com")
+    manager.add_rule("u1", rule)
+    assert len(manager.get_user("u1").rules) == 1
+    assert manager.remove_rule("u1", rule.rule_id)
+    assert manager.get_user("u1").rules == []
+    assert not manager.remove_rule("u1", "missing")
+
+
+def test_get_users_bulk(manager):
+    for i in range(3):
+        manager.save_user(UserProfile(user_id=f"u{i}"))
+    manager.add_rule("u1", InterventionRule(domain="twitter.com"))
+    profiles = manager.get_users_bulk(["u0", "u1", "u2", "missing"])
+    assert set(profiles) == {"u0", "u1", "u2"}
+    assert len(profiles["u1"].rules) == 1
+
+
+def test_update_statistics(manager):
+    manager.get_or_create_user("u1")
+    manager.update_statistics("u1", content_processed=3, decisions_made=2)
+    profile = manager.get_user("u1")
+    assert profile.total_content_processed == 3
+    assert profile.total_decisions_made == 2
+
+
+def test_log_and_get_events(logger):
+    logger.log_event(
+        EventLog(user_id="u1", event_type="TEST", message="hello")
+    )
+    logger.log_event(
+        EventLog(user_id="u2", level=EventLevel.ERROR, event_type="TEST", message="boom")
+    )
+    events = logger.get_events(user_id="u1")
+    assert len(events) == 1
+    assert events[0]["message"] == "hello"
+    errors = logger.get_events(level="error")
+    assert len(errors) == 1